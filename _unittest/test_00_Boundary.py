@@ -0,0 +1,193 @@
+import copy
+import random
+from collections import OrderedDict
+
+try:
+    import unittest.mock
+
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.modeler.Object3d import FacePrimitive
+from pyaedt.modules.Boundary import BoundaryObject
+from pyaedt.modules.Boundary import BoundaryProps
+from pyaedt.modules.Boundary import MaxwellParameters
+from pyaedt.modules.Boundary import NativeComponentObject
+
+
+def _reference_update_props(d, u):
+    """Recursive merge that ``NativeComponentObject._update_props`` must reproduce."""
+    for k, v in u.items():
+        if isinstance(v, (dict, OrderedDict)):
+            if k not in d:
+                d[k] = OrderedDict({})
+            d[k] = _reference_update_props(d[k], v)
+        else:
+            d[k] = v
+    return d
+
+
+def _random_tree(rnd, depth=0):
+    """Build a random tree of nested properties."""
+    tree = OrderedDict()
+    for _ in range(rnd.randint(0, 4)):
+        key = rnd.choice("abcdef")
+        if depth < 3 and rnd.random() < 0.4:
+            tree[key] = _random_tree(rnd, depth + 1)
+        else:
+            tree[key] = rnd.choice([0, 1.5, "x", [1, 2]])
+    return tree
+
+
+def _compatible(d, u):
+    """Check that the merge never descends into a value that is not a dictionary."""
+    for k, v in u.items():
+        if isinstance(v, dict) and k in d and not (isinstance(d[k], dict) and _compatible(d[k], v)):
+            return False
+    return True
+
+
+class TestClass(object):
+    def test_01_delete_many(self):
+        app = unittest.mock.MagicMock()
+        app.boundaries = []
+        rad = BoundaryObject(app, "Rad1", {"Objects": ["Box1"]}, "Radiation")
+        pec = BoundaryObject(app, "PerfE1", {"Faces": [7]}, "Perfect E")
+        kept = BoundaryObject(app, "PerfE2", {"Faces": [8]}, "Perfect E")
+        matrix = MaxwellParameters(app, "Matrix1", {"MatrixEntry": {}}, "Matrix")
+        app.boundaries.extend([rad, pec, kept, matrix])
+        assert BoundaryObject.delete_many(app, [rad, pec, matrix])
+        app.oboundary.DeleteBoundaries.assert_called_once_with(["Rad1", "PerfE1"])
+        app.o_maxwell_parameters.DeleteParameters.assert_called_once_with(["Matrix1"])
+        assert app.boundaries == [kept]
+
+    def test_02_delete_many_other_types(self):
+        app = unittest.mock.MagicMock()
+        app.boundaries = []
+        component = unittest.mock.MagicMock()
+        component.delete.return_value = True
+        assert BoundaryObject.delete_many(app, [component])
+        component.delete.assert_called_once_with()
+        app.oboundary.DeleteBoundaries.assert_not_called()
+
+    def test_03_dispatch_create_update(self):
+        app = unittest.mock.MagicMock()
+        for boundary_type, assign, edit in [
+            ("Perfect E", "AssignPerfectE", "EditPerfectE"),
+            ("Layered Impedance", "AssignLayeredImp", "EditLayeredImpedance"),
+            ("Sink", "AssignSink", "EditTerminal"),
+            ("EndConnection", "AssignEndConnection", "EditEndConnection"),
+        ]:
+            bound = BoundaryObject(app, "B1", {"Faces": [1]}, boundary_type)
+            assert bound.create()
+            getattr(app.oboundary, assign).assert_called_once_with(["NAME:B1", "Faces:=", [1]])
+            assert bound.update()
+            getattr(app.oboundary, edit).assert_called_once_with("B1", ["NAME:B1", "Faces:=", [1]])
+
+    def test_04_dispatch_without_edit_method(self):
+        app = unittest.mock.MagicMock()
+        bound = BoundaryObject(app, "Conv1", {"Faces": [1]}, "Convection")
+        assert bound.create()
+        app.oboundary.AssignConvection.assert_called_once_with(["NAME:Conv1", "Faces:=", [1]])
+        assert not bound.update()
+        bound = BoundaryObject(app, "Unknown1", {"Faces": [1]}, "Unknown")
+        assert not bound.create()
+        assert not bound.update()
+        assert len(app.oboundary.method_calls) == 1
+
+    def test_05_type_setter_resolves_methods(self):
+        bound = BoundaryObject(unittest.mock.MagicMock(), "B1", {}, "Radiation")
+        assert (bound._assign_method, bound._edit_method) == ("AssignRadiation", "EditRadiation")
+        bound.type = "SourceIcepak"
+        assert (bound._assign_method, bound._edit_method) == ("AssignSourceBoundary", None)
+        bound.type = "Unknown"
+        assert (bound._assign_method, bound._edit_method) == (None, None)
+
+    def test_06_native_component_update_props(self):
+        props = OrderedDict(
+            [
+                ("TargetCS", "CS1"),
+                (
+                    "NativeComponentDefinitionProvider",
+                    OrderedDict([("Type", "PCB"), ("Size", OrderedDict([("X", 1)]))]),
+                ),
+                ("New", OrderedDict([("A", OrderedDict([("B", 2)]))])),
+            ]
+        )
+        component = NativeComponentObject(unittest.mock.MagicMock(), "PCB", "Comp1", props)
+        assert component.props["TargetCS"] == "CS1"
+        assert component.native_properties == {"Type": "PCB", "Size": {"X": 1}}
+        assert component.props["New"] == {"A": {"B": 2}}
+        assert props["New"]["A"] == {"B": 2}
+
+    def test_07_update_props_random_trees(self):
+        component = NativeComponentObject(unittest.mock.MagicMock(), "PCB", "Comp1", None)
+        rnd = random.Random(0)
+        for _ in range(1000):
+            d = _random_tree(rnd)
+            u = _random_tree(rnd)
+            if not _compatible(d, u):
+                continue
+            expected = _reference_update_props(copy.deepcopy(d), u)
+            result = component._update_props(d, u)
+            assert result == expected
+
+    def test_08_native_component_default_props(self):
+        component = NativeComponentObject(unittest.mock.MagicMock(), "PCB", "Comp1", None)
+        assert list(component.props.keys())[:4] == [
+            "TargetCS",
+            "SubmodelDefinitionName",
+            "ComponentPriorityLists",
+            "NextUniqueID",
+        ]
+        assert list(component.props.keys())[-1] == "InstanceParameters"
+        assert isinstance(component.props["BasicComponentInfo"], BoundaryProps)
+        assert list(component.props["BasicComponentInfo"].keys())[:2] == ["ComponentName", "Company"]
+        assert component.native_properties == {"Type": "PCB"}
+        assert component.props["UniqueDefinitionIdentifier"].startswith("89d26167-fb77-480e-a7ab-")
+        assert len(component.props["UniqueDefinitionIdentifier"]) == 36
+
+    def test_09_native_component_update(self):
+        app = unittest.mock.MagicMock()
+        props = {"NativeComponentDefinitionProvider": {"Type": "PCB", "Size": "0.1mm"}}
+        component = NativeComponentObject(app, "PCB", "Comp1", props)
+        component.props["BasicComponentInfo"]._setitem_without_update("Company", "ACME")
+        assert component.update()
+        args = app.modeler.oeditor.EditNativeComponentDefinition.call_args[0][0]
+        assert args[:3] == ["NAME:EditNativeComponentDefinitionData", "DefinitionName:=", "Comp1"]
+        assert [a for a in args if isinstance(a, str) and a.endswith(":=")] == [
+            "DefinitionName:=",
+            "NextUniqueID:=",
+            "MoveBackwards:=",
+            "DatasetType:=",
+            "ComponentName:=",
+            "Company:=",
+            "Model Number:=",
+            "Help URL:=",
+            "Version:=",
+            "Notes:=",
+            "IconType:=",
+        ]
+        assert args[args.index("Company:=") + 1] == "ACME"
+        assert ["NAME:NativeComponentDefinitionProvider", "Type:=", "PCB", "Size:=", "0.1mm"] in args
+        assert [a[0] for a in args if isinstance(a, list)] == [
+            "NAME:GeometryDefinitionParameters",
+            "NAME:DesignDefinitionParameters",
+            "NAME:MaterialDefinitionParameters",
+            "NAME:DatasetDefinitions",
+            "NAME:NativeComponentDefinitionProvider",
+        ]
+
+    def test_10_update_assignment(self):
+        app = unittest.mock.MagicMock()
+        bound = BoundaryObject(app, "PerfE1", {"Faces": [FacePrimitive(None, 7), 8]}, "Perfect E")
+        assert bound.update_assignment()
+        app.oboundary.ReassignBoundary.assert_called_with(["Name:PerfE1", "Faces:=", [7, 8]])
+        bound.props._setitem_without_update("Faces", 9)
+        assert bound.update_assignment()
+        app.oboundary.ReassignBoundary.assert_called_with(["Name:PerfE1", "Faces:=", [9]])
+        bound = BoundaryObject(app, "Rad1", {"Objects": ["Box1"]}, "Radiation")
+        assert bound.update_assignment()
+        app.oboundary.ReassignBoundary.assert_called_with(["Name:Rad1", "Objects:=", ["Box1"]])
+        assert not BoundaryObject(app, "Rad2", {}, "Radiation").update_assignment()
@@ -0,0 +1,151 @@
+import random
+from collections import OrderedDict
+
+try:
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.generic.DataHandlers import _dict2arg
+from pyaedt.modeler.Object3d import EdgePrimitive
+from pyaedt.modeler.Object3d import FacePrimitive
+from pyaedt.modeler.Object3d import VertexPrimitive
+
+
+def _reference_dict2arg(d, arg_out):
+    """Straightforward recursive conversion that ``_dict2arg`` must reproduce."""
+    for k, v in d.items():
+        if "_pyaedt" in k:
+            continue
+        if k == "Point" or k == "DimUnits":
+            if isinstance(v[0], (list, tuple)):
+                for e in v:
+                    arg_out.append(["NAME:" + k, e[0], e[1]])
+            else:
+                arg_out.append(["NAME:" + k, v[0], v[1]])
+        elif k == "Range":
+            if isinstance(v[0], (list, tuple)):
+                for e in v:
+                    arg_out.append(k + ":=")
+                    arg_out.append([i for i in e])
+            else:
+                arg_out.append(k + ":=")
+                arg_out.append([i for i in v])
+        elif isinstance(v, (OrderedDict, dict)):
+            arg = ["NAME:" + k]
+            _reference_dict2arg(v, arg)
+            arg_out.append(arg)
+        elif v is None:
+            arg_out.append(["NAME:" + k])
+        elif type(v) is list and len(v) > 0 and isinstance(v[0], (OrderedDict, dict)):
+            for el in v:
+                arg = ["NAME:" + k]
+                _reference_dict2arg(el, arg)
+                arg_out.append(arg)
+        else:
+            arg_out.append(k + ":=")
+            if type(v) in (EdgePrimitive, FacePrimitive, VertexPrimitive):
+                arg_out.append(v.id)
+            else:
+                arg_out.append(v)
+
+
+def _random_props(rnd, depth=0):
+    """Build a random tree of AEDT properties."""
+    props = OrderedDict()
+    for i in range(rnd.randint(0, 6)):
+        key = rnd.choice(["Name", "Value", "Point", "DimUnits", "Range", "_pyaedt_ref", "Items", "Sub"]) + str(i)
+        kind = rnd.randint(0, 9 if depth < 3 else 5)
+        if key.startswith(("Point", "DimUnits", "Range")):
+            key = key.rstrip("0123456789")
+            if rnd.random() < 0.5:
+                value = [[rnd.random(), "mm"] for _ in range(rnd.randint(1, 3))]
+            else:
+                value = [rnd.randint(0, 9), "mm"]
+        elif kind == 0:
+            value = rnd.choice(["a", "b", ""])
+        elif kind == 1:
+            value = rnd.randint(-5, 5)
+        elif kind == 2:
+            value = rnd.random()
+        elif kind == 3:
+            value = rnd.random() < 0.5
+        elif kind == 4:
+            value = None
+        elif kind == 5:
+            value = [rnd.randint(0, 9) for _ in range(rnd.randint(0, 3))]
+        elif kind == 6:
+            value = FacePrimitive(None, rnd.randint(1, 100))
+        elif kind == 7:
+            value = _random_props(rnd, depth + 1)
+        elif kind == 8:
+            value = dict(_random_props(rnd, depth + 1))
+        else:
+            value = [_random_props(rnd, depth + 1) for _ in range(rnd.randint(1, 3))]
+        props[key] = value
+    return props
+
+
+class TestClass(object):
+    def test_01_dict2arg(self):
+        props = OrderedDict(
+            [
+                ("Name", "Setup1"),
+                ("Enabled", True),
+                ("Count", 3),
+                ("Ratio", 0.5),
+                ("_pyaedt_parent", "skipped"),
+                ("Point", [[0, 1], [2, 3]]),
+                ("DimUnits", ["mm", "deg"]),
+                ("Range", ["1GHz", "2GHz"]),
+                ("Sweep", OrderedDict([("Range", [["a", "b"], ["c", "d"]])])),
+                ("Nested", OrderedDict([("A", 1), ("B", OrderedDict([("C", "x")]))])),
+                ("Empty", None),
+                ("Items", [OrderedDict([("X", 1)]), OrderedDict([("X", 2)])]),
+                ("Values", [1, 2, 3]),
+                ("NoValues", []),
+                ("Pair", (1, 2)),
+                ("Face", FacePrimitive(None, 7)),
+            ]
+        )
+        arg = ["NAME:Setup1"]
+        _dict2arg(props, arg)
+        assert arg == [
+            "NAME:Setup1",
+            "Name:=",
+            "Setup1",
+            "Enabled:=",
+            True,
+            "Count:=",
+            3,
+            "Ratio:=",
+            0.5,
+            ["NAME:Point", 0, 1],
+            ["NAME:Point", 2, 3],
+            ["NAME:DimUnits", "mm", "deg"],
+            "Range:=",
+            ["1GHz", "2GHz"],
+            ["NAME:Sweep", "Range:=", ["a", "b"], "Range:=", ["c", "d"]],
+            ["NAME:Nested", "A:=", 1, ["NAME:B", "C:=", "x"]],
+            ["NAME:Empty"],
+            ["NAME:Items", "X:=", 1],
+            ["NAME:Items", "X:=", 2],
+            "Values:=",
+            [1, 2, 3],
+            "NoValues:=",
+            [],
+            "Pair:=",
+            (1, 2),
+            "Face:=",
+            7,
+        ]
+
+    def test_02_dict2arg_random_trees(self):
+        rnd = random.Random(0)
+        for _ in range(2000):
+            props = _random_props(rnd)
+            arg = ["NAME:Test"]
+            _dict2arg(props, arg)
+            expected = ["NAME:Test"]
+            _reference_dict2arg(props, expected)
+            assert arg == expected
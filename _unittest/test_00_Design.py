@@ -0,0 +1,40 @@
+try:
+    import unittest.mock
+
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.application.Design import Design
+
+
+def _design(version):
+    """Build a design bound to a mocked project of the given AEDT version."""
+    design = Design.__new__(Design)
+    design._aedt_version = version
+    design._oo_enabled = None
+    design._oproject = unittest.mock.MagicMock()
+    design.check_beta_option_enabled = unittest.mock.MagicMock(return_value=False)
+    return design
+
+
+class TestClass(object):
+    def test_01_object_oriented_check_cached(self):
+        design = _design("2021.2")
+        assert design._is_object_oriented_enabled()
+        assert design._is_object_oriented_enabled()
+        design.check_beta_option_enabled.assert_called_once_with("SF159726_SCRIPTOBJECT")
+        design._oproject.GetChildObject.assert_called_once_with("Variables")
+
+    def test_02_object_oriented_check_disabled(self):
+        design = _design("2021.2")
+        design._oproject.GetChildObject.side_effect = Exception
+        assert not design._is_object_oriented_enabled()
+        assert not design._is_object_oriented_enabled()
+        assert design._oproject.GetChildObject.call_count == 1
+
+    def test_03_object_oriented_check_recent_versions(self):
+        design = _design("2022.1")
+        assert design._is_object_oriented_enabled()
+        design.check_beta_option_enabled.assert_not_called()
+        design._oproject.GetChildObject.assert_not_called()
@@ -0,0 +1,198 @@
+import copy
+from collections import OrderedDict
+
+try:
+    import unittest.mock
+
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.modules import OptimetricsTemplates
+from pyaedt.modules.DesignXPloration import OptimizationSetups
+from pyaedt.modules.DesignXPloration import ParametricSetups
+from pyaedt.modules.DesignXPloration import SetupOpti
+from pyaedt.modules.DesignXPloration import SetupParam
+from pyaedt.modules.DesignXPloration import _clone
+from pyaedt.modules.DesignXPloration import _default_setups
+
+_templates = {
+    "OptiParametric": OptimetricsTemplates.defaultparametricSetup,
+    "OptiDesignExplorer": OptimetricsTemplates.defaultdxSetup,
+    "OptiOptimization": OptimetricsTemplates.defaultoptiSetup,
+    "OptiSensitivity": OptimetricsTemplates.defaultsensitivitySetup,
+    "OptiStatistical": OptimetricsTemplates.defaultstatisticalSetup,
+    "OptiDXDOE": OptimetricsTemplates.defaultdoeSetup,
+}
+
+
+def _containers(obj):
+    """Return the ids of all the containers of a properties tree."""
+    ids = []
+    if isinstance(obj, (list, tuple)):
+        ids.append(id(obj))
+        for v in obj:
+            ids.extend(_containers(v))
+    elif hasattr(obj, "items"):
+        ids.append(id(obj))
+        for v in obj.values():
+            ids.extend(_containers(v))
+    return ids
+
+
+def _app():
+    """Mock an HFSS design with two setups and the ``x`` and ``y`` variables."""
+    app = unittest.mock.MagicMock()
+    app.nominal_sweep = "Setup1 : LastAdaptive"
+    app.existing_analysis_sweeps = ["Setup1 : LastAdaptive", "Setup2 : Sweep"]
+    app.solution_type = "Modal"
+    app.modeler.line_names = ["Line1"]
+    app.modeler.sheet_names = []
+    app.design_solutions.report_type = "Modal Solution Data"
+    app.field_setups = []
+    app.variable_manager.variables = {"x": "1mm", "y": "2mm"}
+    app.variable_manager.__getitem__.return_value.units = "mm"
+    app.value_with_units.side_effect = lambda value, units: "{}{}".format(value, units)
+    app._is_object_oriented_enabled.return_value = False
+    return app
+
+
+class TestClass(object):
+    def test_01_clone_default_equals_deepcopy(self):
+        for name, template in _templates.items():
+            assert _clone(_default_setups[name]) == copy.deepcopy(template)
+
+    def test_02_clone_default_is_mutable(self):
+        for name in _templates:
+            clone = _clone(_default_setups[name])
+            clone["NewKey"] = 1
+            for key, value in clone.items():
+                if isinstance(value, list):
+                    value.append(1)
+                elif isinstance(value, dict):
+                    value["NewKey"] = 1
+            assert "NewKey" not in _default_setups[name]
+
+    def test_03_clone_shares_no_containers(self):
+        for name in _templates:
+            frozen = _default_setups[name]
+            assert not set(_containers(_clone(frozen))) & set(_containers(frozen))
+
+    def test_04_setup_from_frozen_default(self):
+        # A frozen default passed back as setup input must be copied, not handed to deepcopy.
+        app = unittest.mock.MagicMock()
+        app._is_object_oriented_enabled.return_value = False
+        app.design_properties = {"SolutionManager": {"ID Map": {"Setup": [{"I": 1, "N": "Setup1"}]}}}
+        setup = SetupOpti(app, "Opt1", dictinputs=_default_setups["OptiOptimization"], optim_type="OptiOptimization")
+        assert isinstance(setup.props["Goals"], dict)
+        setup.props["AnalysisStopOptions"]["MaxNumIteration"] = 10
+        assert _default_setups["OptiOptimization"]["AnalysisStopOptions"]["MaxNumIteration"] == 1000
+
+    def test_05_update_skips_unchanged_setup(self):
+        app = unittest.mock.MagicMock()
+        setup = SetupOpti(app, "Opt1", optim_type="OptiOptimization")
+        assert setup.create()
+        assert setup.update()
+        assert setup.update()
+        setup.omodule.EditSetup.assert_not_called()
+        setup.props._setitem_without_update("Optimizer", "Genetic Algorithm")
+        assert setup.update()
+        assert setup.update()
+        assert setup.omodule.EditSetup.call_count == 1
+
+    def test_06_add_calculation_ranges(self):
+        setup = SetupOpti(_app(), "DOE1", optim_type="OptiDXDOE")
+        ranges = OrderedDict([("Freq", ("1GHz", "2GHz")), ("Phi", ["0deg", "90deg"]), ("Theta", None)])
+        assert setup.add_calculation("dB(S(1,1))", ranges, solution="Setup2 : Sweep")
+        assert setup.props["Sim. Setups"] == ["Setup2"]
+        goal = setup.props["Goals"]["Goal"]
+        assert goal["ReportType"] == "Modal Solution Data"
+        assert goal["Solution"] == "Setup2 : Sweep"
+        assert goal["SimValueContext"] == {"Domain": "Sweep"}
+        assert goal["Ranges"]["Range"] == [
+            ("Var:=", "Freq", "Type:=", "rd", "Start:=", "1GHz", "Stop:=", "2GHz", "DiscreteValues:=", ""),
+            ("Var:=", "Phi", "Type:=", "d", "DiscreteValues:=", "0deg,90deg"),
+            ("Var:=", "Theta", "Type:=", "a"),
+        ]
+        assert "Condition" not in goal
+
+    def test_07_add_calculation_on_line(self):
+        setup = SetupOpti(_app(), "DOE1", optim_type="OptiDXDOE")
+        assert setup.add_calculation("mag(E)", {"Freq": "1GHz"}, context="Line1", polyline_points=11)
+        goal = setup.props["Goals"]["Goal"]
+        assert goal["SimValueContext"] == {"Context": "Line1", "PointCount": 11}
+        assert goal["Ranges"]["Range"] == [
+            ("Var:=", "Distance", "Type:=", "a"),
+            ("Var:=", "Freq", "Type:=", "d", "DiscreteValues:=", "1GHz"),
+        ]
+
+    def test_08_add_goals(self):
+        app = _app()
+        setup = SetupOpti(app, "DX1", optim_type="OptiDesignExplorer")
+        assert setup.add_goal("dB(S(2,1))", {"Freq": "1GHz"}, variables=["x"], condition=">=", goal_value=-3)
+        goal = setup.props["CostFunctionGoals"]["Goal"]
+        assert goal["Condition"] == ">="
+        assert goal["GoalValue"] == {"GoalValueType": "Independent", "Format": "Real/Imag", "bG": ["v:=", "[-3;]"]}
+        assert goal["Weight"] == "[1;]"
+        app.activate_variable_optimization.assert_called_once_with("x")
+        assert setup.add_goal("dB(S(1,1))", {"Freq": "2GHz"}, goal_weight=2)
+        assert setup.add_goal("dB(S(1,2))", {"Freq": "3GHz"})
+        goals = setup.props["CostFunctionGoals"]["Goal"]
+        assert [g["Calculation"] for g in goals] == ["dB(S(2,1))", "dB(S(1,1))", "dB(S(1,2))"]
+        assert goals[1]["Weight"] == "[2;]"
+        assert setup.add_calculation("dB(S(2,2))", {"Freq": "1GHz"})
+        assert setup.props["Goals"]["Goal"]["Calculation"] == "dB(S(2,2))"
+
+    def test_09_parametric_sweeps(self):
+        app = _app()
+        setup = SetupParam(app, "Par1")
+        assert setup.add_variation("x", 1, 5, 10, "mm")
+        assert setup.add_variation("y", 0, 2, 0.5, "mm", "LinearStep")
+        assert setup.add_variation("x", 7, 8, 2, "mm")
+        sweeps = setup.props["Sweeps"]["SweepDefinition"]
+        assert [(s["Variable"], s["Data"]) for s in sweeps[1:]] == [
+            ("x", "LINC 1mm 5mm 10 LINC 7mm 8mm 2"),
+            ("y", "LIN 0mm 2mm 0.5mm"),
+        ]
+        assert sweeps[1] == OrderedDict(
+            [("Variable", "x"), ("Data", "LINC 1mm 5mm 10 LINC 7mm 8mm 2"), ("OffsetF1", False), ("Synchronize", 0)]
+        )
+        assert setup.sync_variables(["x", "y"])
+        assert [s["Synchronize"] for s in sweeps[1:]] == [1, 1]
+        assert not setup.add_variation("z", 0, 1)
+
+    def test_10_load_stored_setups(self):
+        app = _app()
+        app.design_properties = {
+            "Optimetrics": {
+                "OptimetricsSetups": OrderedDict(
+                    [
+                        ("Par1", {"SetupType": "OptiParametric", "ID": 1}),
+                        ("Opt1", {"SetupType": "OptiOptimization"}),
+                        ("Untyped", {"ID": 3}),
+                        ("NextUniqueID", 4),
+                        ("Sens1", {"SetupType": "OptiSensitivity"}),
+                        ("Par2", {"SetupType": "OptiParametric"}),
+                    ]
+                )
+            },
+        }
+        parametrics = ParametricSetups(app).setups
+        assert [(s.name, s.soltype) for s in parametrics] == [("Par1", "OptiParametric"), ("Par2", "OptiParametric")]
+        assert "ID" not in parametrics[0].props
+        optimizations = OptimizationSetups(app).setups
+        assert [(s.name, s.soltype) for s in optimizations] == [
+            ("Opt1", "OptiOptimization"),
+            ("Sens1", "OptiSensitivity"),
+        ]
+
+    def test_11_setup_ids_to_names(self):
+        app = _app()
+        app.design_properties = {
+            "SolutionManager": {"ID Map": {"Setup": [{"I": 1, "N": "Setup1"}, {"I": 2, "N": "Setup2"}]}}
+        }
+        setup = SetupParam(app, "Par1", {"SetupType": "OptiParametric", "Sim. Setups": [2, 1, 3]})
+        assert setup.props["Sim. Setups"] == ["Setup2", "Setup1", 3]
+        app.design_properties["SolutionManager"]["ID Map"]["Setup"] = {"I": 1, "N": "Setup1"}
+        setup = SetupParam(app, "Par1", {"SetupType": "OptiParametric", "Sim. Setups": [1]})
+        assert setup.props["Sim. Setups"] == ["Setup1"]
@@ -0,0 +1,28 @@
+try:
+    import unittest.mock
+
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.modeler.Modeler import GeometryModeler
+
+
+class TestClass(object):
+    def test_01_model_units_cache(self):
+        app = unittest.mock.MagicMock()
+        app.oeditor.GetModelUnits.return_value = "mm"
+        modeler = GeometryModeler(app)
+        oeditor = modeler.oeditor
+        assert modeler.model_units == "mm"
+        assert modeler.model_units == "mm"
+        assert oeditor.GetModelUnits.call_count == 1
+        oeditor.GetModelUnits.return_value = "in"
+        assert modeler.model_units == "mm"
+        assert modeler.invalidate_cache()
+        assert modeler.model_units == "in"
+        modeler.model_units = "cm"
+        oeditor.SetModelUnits.assert_called_once()
+        oeditor.GetModelUnits.return_value = "cm"
+        assert modeler.model_units == "cm"
+        assert oeditor.GetModelUnits.call_count == 3
@@ -0,0 +1,246 @@
+import copy
+import os
+import shutil
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import unittest.mock
+
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.modules.AdvancedPostProcessing import PostProcessor
+from pyaedt.modules.AdvancedPostProcessing import _sweep_range
+from pyaedt.modules.PostProcessor import _convert_dict_to_variation_list
+
+
+class TestClass(object):
+    def test_01_variation_list_from_dict(self):
+        variations = OrderedDict([("Freq", "1GHz"), ("Phase", "0deg")])
+        assert _convert_dict_to_variation_list(variations) == ["Freq:=", "1GHz", "Phase:=", "0deg"]
+        assert _convert_dict_to_variation_list({}) == []
+
+    def test_02_variation_list_from_list(self):
+        variations = ["Freq:=", "1GHz"]
+        variation_list = _convert_dict_to_variation_list(variations)
+        assert variation_list == variations
+        variation_list.append("Phase:=")
+        assert variations == ["Freq:=", "1GHz"]
+
+    def test_03_variation_list_from_none(self):
+        assert _convert_dict_to_variation_list(None) == []
+
+    def test_04_animation_cache_skips_failed_exports(self, tmp_path):
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._app.working_directory = str(tmp_path)
+        post._aedtplt_cache = {}
+        post.get_model_plotter_geometries = unittest.mock.MagicMock()
+        frame = tmp_path / "frame0.aedtplt"
+        frame.write_text("")
+        post.export_field_plot = unittest.mock.MagicMock(side_effect=[str(frame), False])
+        post.animate_fields_from_aedtplt("Plot1", variation_list=["0deg", "90deg"], show=False, use_cache=True)
+        post.get_model_plotter_geometries.return_value.add_frames_from_file.assert_called_once_with([str(frame)])
+        assert post._aedtplt_cache == {}
+
+        post.export_field_plot = unittest.mock.MagicMock(return_value=str(frame))
+        post.animate_fields_from_aedtplt("Plot1", variation_list=["0deg", "90deg"], show=False, use_cache=True)
+        assert list(post._aedtplt_cache.values()) == [[str(frame), str(frame)]]
+        post.animate_fields_from_aedtplt("Plot1", variation_list=["0deg", "90deg"], show=False, use_cache=True)
+        assert post.export_field_plot.call_count == 2
+
+    def test_05_sweep_range(self):
+        # Values as returned by AEDT: phi is the outer loop and theta the inner one.
+        theta = np.tile(np.deg2rad(np.arange(0, 181, 5)), 3)
+        for values in (np.rad2deg(theta), np.array([10.0]), np.array([0.0, 0.1, 0.3, 1.0])):
+            expected = np.linspace(np.min(values), np.max(values), np.size(np.unique(values)))
+            assert np.allclose(_sweep_range(values), expected)
+        uniform = np.array([2.0, 0.0, 1.0, 2.0])
+        assert np.array_equal(_sweep_range(uniform), [0.0, 1.0, 2.0])
+
+    def test_06_export_model_obj_to_tempdir(self, tmp_path):
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._app._aedt_version = "2022.2"
+        post._app.working_directory = str(tmp_path)
+        files = post.export_model_obj(["Box1"])
+        assert files == [[os.path.join(str(tmp_path), "Model_AllObjs_AllMats.obj"), "grey", 0.6]]
+        files = post.export_model_obj(["Box1"], use_tempdir=True)
+        temp_folder = os.path.dirname(files[0][0])
+        try:
+            assert temp_folder != str(tmp_path)
+            assert os.path.isdir(temp_folder)
+        finally:
+            shutil.rmtree(temp_folder)
+
+    def test_07_export_model_obj_single_objects(self, tmp_path):
+        objects = {
+            "Box1": unittest.mock.Mock(
+                is3d=True, material_name="copper", display_wireframe=False, transparency=0.2, color=(255, 0, 0)
+            ),
+            "Region": unittest.mock.Mock(is3d=True, material_name="Air", display_wireframe=True, color=(0, 0, 0)),
+            "Sheet1": unittest.mock.Mock(
+                is3d=False, material_name="vacuum", display_wireframe=False, transparency=0, color=(0, 0, 255)
+            ),
+            "Wire1": unittest.mock.Mock(is3d=True, material_name="copper", display_wireframe=True, color=(0, 255, 0)),
+        }
+        for name, obj in objects.items():
+            obj.name = name
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._app._aedt_version = "2022.2"
+        post._app.modeler.object_names = list(objects)
+        post._app.modeler.__getitem__.side_effect = objects.__getitem__
+        files = post.export_model_obj(export_path=str(tmp_path), export_as_single_objects=True)
+        assert files == [
+            [os.path.join(str(tmp_path), "Box1.obj"), (255, 0, 0), 0.8],
+            [os.path.join(str(tmp_path), "Sheet1.obj"), (0, 0, 255), 0.4],
+            [os.path.join(str(tmp_path), "Wire1.obj"), (0, 255, 0), 0.05],
+        ]
+        post._app.modeler.oeditor.ExportModelMeshToFile.assert_called_with(
+            os.path.join(str(tmp_path), "Wire1.obj"), ["Wire1"]
+        )
+        files = post.export_model_obj(export_path=str(tmp_path), air_objects=True)
+        post._app.modeler.oeditor.ExportModelMeshToFile.assert_called_with(
+            files[0][0], ["Box1", "Region", "Sheet1", "Wire1"]
+        )
+
+    def test_08_export_field_grid_units(self, tmp_path):
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._app._modeler.model_units = "mm"
+        filename = str(tmp_path / "field.fld")
+        for gridtype, center, start, stop, step in [
+            ("Cartesian", ["0mm"] * 3, ["0mm", "1mm", "2mm"], ["3mm", "4mm", "5mm"], ["0.5mm", "1mm", "1mm"]),
+            (
+                "Cylindrical",
+                ["1mm", "2mm", "3mm"],
+                ["0mm", "1deg", "2mm"],
+                ["3mm", "4deg", "5mm"],
+                ["0.5mm", "1deg", "1mm"],
+            ),
+            (
+                "Spherical",
+                ["1mm", "2mm", "3mm"],
+                ["0mm", "1deg", "2deg"],
+                ["3mm", "4deg", "5deg"],
+                ["0.5mm", "1deg", "1deg"],
+            ),
+        ]:
+            post.export_field_file_on_grid(
+                "Mag_E",
+                "Setup1 : LastAdaptive",
+                {"x": "1mm"},
+                filename,
+                gridtype,
+                [1, 2, 3],
+                [0, 1, 2],
+                [3, 4, 5],
+                [0.5, 1, 1],
+            )
+            post._app.ofieldsreporter.ExportOnGrid.assert_called_with(
+                filename, start, stop, step, "Setup1 : LastAdaptive", ["x:=", "1mm"], True, gridtype, center, False
+            )
+        assert not post.export_field_file_on_grid("Mag_E", "Setup1 : LastAdaptive", {}, filename, "Unknown")
+
+    def test_09_get_efields_data(self):
+        theta = np.tile(np.deg2rad([0.0, 45.0, 90.0, 135.0, 180.0]), 2)
+        phi = np.repeat(np.deg2rad([0.0, 90.0]), 5)
+        contexts = []
+        data = unittest.mock.MagicMock()
+        data.GetSweepValues.side_effect = {"Theta": theta, "Phi": phi}.get
+
+        def real_values(expr):
+            # The field of each source is offset by the index of the source set to 1W.
+            active = [c[3] for c in contexts[-1][1:]].index("1W")
+            return np.arange(10.0) + 10 * active + (expr == "rEPhi")
+
+        data.GetRealDataValues.side_effect = real_values
+        data.GetImagDataValues.side_effect = lambda expr: -np.arange(10.0) - (expr == "rEPhi")
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._post_osolution = unittest.mock.MagicMock()
+        post._post_osolution.GetAllSources.return_value = ["P1", "P2"]
+        post._post_osolution.EditSources.side_effect = lambda ctxt: contexts.append(copy.deepcopy(ctxt))
+        post.get_far_field_data = unittest.mock.MagicMock()
+        post.get_far_field_data.return_value.nominal_variation = data
+        results = post.get_efields_data("Setup1 : LastAdaptive")
+        header = ["IncludePortPostProcessing:=", False, "SpecifySystemPower:=", False]
+        assert contexts == [
+            [
+                header,
+                ["Name:=", "P1:1", "Magnitude:=", "1W", "Phase:=", "0deg"],
+                ["Name:=", "P2:1", "Magnitude:=", "0W", "Phase:=", "0deg"],
+            ],
+            [
+                header,
+                ["Name:=", "P1:1", "Magnitude:=", "0W", "Phase:=", "0deg"],
+                ["Name:=", "P2:1", "Magnitude:=", "1W", "Phase:=", "0deg"],
+            ],
+        ]
+        assert list(results) == ["P1", "P2"]
+        for n, (theta_range, phi_range, e_theta, e_phi) in enumerate(results.values()):
+            assert np.allclose(theta_range, [0.0, 45.0, 90.0, 135.0, 180.0])
+            assert np.allclose(phi_range, [0.0, 90.0])
+            assert np.allclose(e_theta, np.arange(10.0) + 10 * n - 1j * np.arange(10.0))
+            assert np.allclose(e_phi, np.arange(10.0) + 10 * n + 1 - 1j * (np.arange(10.0) + 1))
+
+    def test_10_animation_keeps_intrinsics(self, tmp_path):
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._aedtplt_cache = {}
+        post.get_model_plotter_geometries = unittest.mock.MagicMock()
+        post.export_field_plot = unittest.mock.MagicMock(side_effect=["frame0.aedtplt", "frame1.aedtplt"])
+        post.create_fieldplot_surface = unittest.mock.MagicMock()
+        post.create_fieldplot_surface.return_value.name = "Plot"
+        intrinsics = {"Freq": "1GHz"}
+        post.animate_fields_from_aedtplt_2(
+            "Mag_E",
+            ["Box1"],
+            "Surface",
+            setup_name="Setup1 : LastAdaptive",
+            intrinsic_dict=intrinsics,
+            variation_variable="Phase",
+            variation_list=["0deg", "90deg"],
+            project_path=str(tmp_path),
+            show=False,
+        )
+        assert intrinsics == {"Freq": "1GHz"}
+        assert [c[0][3] for c in post.create_fieldplot_surface.call_args_list] == [
+            {"Freq": "1GHz", "Phase": "0deg"},
+            {"Freq": "1GHz", "Phase": "90deg"},
+        ]
+        post.get_model_plotter_geometries.return_value.add_frames_from_file.assert_called_once_with(
+            ["frame0.aedtplt", "frame1.aedtplt"]
+        )
+
+    def test_11_animation_change_property(self, tmp_path):
+        post = PostProcessor.__new__(PostProcessor)
+        post._app = unittest.mock.MagicMock()
+        post._aedtplt_cache = {}
+        post.get_model_plotter_geometries = unittest.mock.MagicMock()
+        post.export_field_plot = unittest.mock.MagicMock(return_value=False)
+        changes = []
+        post._app._odesign.ChangeProperty.side_effect = lambda arg: changes.append(copy.deepcopy(arg))
+        post.animate_fields_from_aedtplt(
+            "Plot1",
+            variation_variable="Phase",
+            variation_list=["0deg", "90deg"],
+            project_path=str(tmp_path),
+            show=False,
+        )
+        assert changes == [
+            [
+                "NAME:AllTabs",
+                [
+                    "NAME:FieldsPostProcessorTab",
+                    ["NAME:PropServers", "FieldsReporter:Plot1"],
+                    ["NAME:ChangedProps", ["NAME:Phase", "Value:=", value]],
+                ],
+            ]
+            for value in ["0deg", "90deg"]
+        ]
+        assert [c[0][2] for c in post.export_field_plot.call_args_list] == ["Plot1Phase0deg", "Plot1Phase90deg"]
@@ -0,0 +1,28 @@
+try:
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.generic.plot import ModelPlotter
+from pyaedt.generic.plot import _decimation_indices
+
+
+class TestClass(object):
+    def test_01_decimation_keeps_last_index(self):
+        assert list(_decimation_indices(361, 4)) == list(range(0, 361, 4))
+        assert list(_decimation_indices(362, 4)) == list(range(0, 362, 4)) + [361]
+        assert list(_decimation_indices(5, 1)) == [0, 1, 2, 3, 4]
+        assert list(_decimation_indices(1, 3)) == [0]
+        assert list(_decimation_indices(0, 3)) == []
+
+    def test_02_clean_removes_temp_folder(self, tmp_path):
+        temp_folder = tmp_path / "objs"
+        temp_folder.mkdir()
+        (temp_folder / "Box1.obj").write_text("")
+        model = ModelPlotter()
+        model.temp_folder = str(temp_folder)
+        assert model.clean_cache_and_files(remove_objs=False)
+        assert temp_folder.is_dir()
+        assert model.clean_cache_and_files()
+        assert not temp_folder.exists()
+        assert model.temp_folder is None
@@ -0,0 +1,300 @@
+import itertools
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import unittest.mock
+
+    import pytest  # noqa: F401
+except ImportError:
+    import _unittest_ironpython.conf_unittest as pytest  # noqa: F401
+
+from pyaedt.generic.constants import AEDT_UNITS
+from pyaedt.generic.constants import db10
+from pyaedt.generic.constants import db20
+from pyaedt.modeler.Object3d import FacePrimitive
+from pyaedt.modules.solutions import FfdSolutionData
+from pyaedt.modules.solutions import FieldPlot
+from pyaedt.modules.solutions import SolutionData
+
+
+class _VariationData(object):
+    """Solution data of one design variation as returned by ``GetSolutionDataPerVariation``."""
+
+    freqs = [1.0, 2.0, 3.0]
+    phis = [0.0, 90.0]
+
+    def __init__(self, x):
+        self.x = x
+        grid = list(itertools.product(self.freqs, self.phis))
+        self.sweeps = {"Freq": [f for f, _ in grid], "Phi": [p for _, p in grid]}
+        self.real = {
+            "S(1,1)": [0.1 * x * f + 0.01 * p for f, p in grid],
+            "V1": [x * f * 100 + p for f, p in grid],
+        }
+        self.imag = {"S(1,1)": [-0.2 * x * f for f, _ in grid]}
+
+    def GetDesignVariableNames(self):
+        return ["x"]
+
+    def GetDesignVariableValue(self, name):
+        return self.x
+
+    def GetDataExpressions(self):
+        return ["S(1,1)", "V1"]
+
+    def GetSweepNames(self):
+        return ["Phi", "Freq"]
+
+    def GetSweepValues(self, name, unused=True):
+        return self.sweeps[name]
+
+    def GetSweepUnits(self, name):
+        return {"Freq": "GHz", "Phi": "deg"}[name]
+
+    def GetDataUnits(self, expression):
+        return {"S(1,1)": "", "V1": "mV"}[expression]
+
+    def IsDataComplex(self, expression):
+        return expression in self.imag
+
+    def GetRealDataValues(self, expression, unused=True):
+        return self.real[expression]
+
+    def GetImagDataValues(self, expression, unused=True):
+        return self.imag[expression]
+
+
+def _field_postprocessor():
+    """Mock a postprocessor whose model has faces 5 and 7 on ``Box1`` and face 6 on a non-model sheet."""
+    postprocessor = unittest.mock.MagicMock()
+    postprocessor.modeler.model_objects = ["Box1"]
+    face_objects = {5: "Box1", 6: "Sheet1", 7: "Box1"}
+    postprocessor.modeler.oeditor.GetObjectNameByFaceID.side_effect = lambda face_id: face_objects[face_id]
+    return postprocessor
+
+
+def _ffd_data(taper):
+    ffd = FfdSolutionData.__new__(FfdSolutionData)
+    ffd.taper = taper
+    ffd._frequency = 28e9
+    ffd.Ax, ffd.Ay = 0.005, 0.0
+    ffd.Bx, ffd.By = 0.001, 0.005
+    ffd.CenterA, ffd.CenterB = 1.5, 1.0
+    ffd.AMax, ffd.BMax = 4.0, 3.0
+    return ffd
+
+
+def _scalar_weight(ffd, a, b, phi_scan, theta_scan):
+    """Weight of one element as computed element by element."""
+    k = (2 * math.pi * ffd.frequency) / 299792458
+    theta_scan = math.radians(theta_scan)
+    phi_scan = math.radians(phi_scan)
+    phase_shift_A_rad = -1 * (
+        (ffd.Ax * k * math.sin(theta_scan) * math.cos(phi_scan))
+        + (ffd.Ay * k * math.sin(theta_scan) * math.sin(phi_scan))
+    )
+    phase_shift_B_rad = -1 * (
+        (ffd.Bx * k * math.sin(theta_scan) * math.cos(phi_scan))
+        + (ffd.By * k * math.sin(theta_scan) * math.sin(phi_scan))
+    )
+    w_mag = np.round(np.abs(ffd.assign_weight(a, b, taper=ffd.taper)), 3)
+    w_ang = a * phase_shift_A_rad + b * phase_shift_B_rad
+    return np.sqrt(w_mag) * np.exp(1j * w_ang)
+
+
+def _array_data():
+    """Far field data of a 3x2 array with the embedded pattern of each port on a 4x5 theta/phi grid."""
+    ffd = _ffd_data("hamming")
+    ffd._app = unittest.mock.MagicMock()
+    rnd = np.random.RandomState(0)
+    ffd.all_port_names = ["Port[{},{}]".format(a, b) for a in range(1, 4) for b in range(1, 3)]
+    ffd.data_dict = {}
+    for port in ffd.all_port_names:
+        ffd.data_dict[port] = {
+            "rETheta": rnd.rand(20) + 1j * rnd.rand(20),
+            "rEPhi": rnd.rand(20) + 1j * rnd.rand(20),
+            "Theta": [0, 30, 60, 90],
+            "Phi": [0, 45, 90, 135, 180],
+        }
+    return ffd
+
+
+def _reference_beamform(ffd, weights):
+    """Combine the port fields with the given weights, one port at a time."""
+    rETheta = sum(w * ffd.data_dict[p]["rETheta"] for p, w in zip(ffd.all_port_names, weights)).reshape(4, 5)
+    rEPhi = sum(w * ffd.data_dict[p]["rEPhi"] for p, w in zip(ffd.all_port_names, weights)).reshape(4, 5)
+    rETotal = np.sqrt(np.abs(rETheta) ** 2 + np.abs(rEPhi) ** 2)
+    pin = sum(abs(w) ** 2 for w in weights)
+    real_gain = 2 * np.pi * rETotal**2 / pin / 377
+    return {"rETheta": rETheta, "rEPhi": rEPhi, "rETotal": rETotal, "Pincident": pin, "RealizedGain": real_gain}
+
+
+class TestClass(object):
+    def test_01_taper_magnitudes(self):
+        indices = np.array([[a, b] for a in range(4) for b in range(3)])
+        for taper in ["flat", "cosine", "triangular", "hamming"]:
+            ffd = _ffd_data(taper)
+            expected = [np.round(np.abs(ffd.assign_weight(a, b, taper=taper)), 3) for a, b in indices]
+            assert np.array_equal(ffd._taper_magnitudes(indices), expected)
+
+    def test_02_progressive_phase_weights(self):
+        indices = np.array([[a, b] for a in range(4) for b in range(3)])
+        for taper in ["flat", "hamming"]:
+            ffd = _ffd_data(taper)
+            for phi_scan, theta_scan in [(0, 0), (30, 20), (-45, 60)]:
+                expected = [_scalar_weight(ffd, a, b, phi_scan, theta_scan) for a, b in indices]
+                assert np.allclose(ffd._progressive_phase_weights(indices, phi_scan, theta_scan), expected)
+
+    def test_03_progressive_phase_weights_two_beams(self):
+        indices = np.array([[a, b] for a in range(1, 5) for b in range(1, 4)])
+        ffd = _ffd_data("cosine")
+        mag = ffd._taper_magnitudes(indices)
+        w = ffd._progressive_phase_weights(indices, 10, 30, mag)
+        w += ffd._progressive_phase_weights(indices, 80, 15, mag)
+        expected = [_scalar_weight(ffd, a, b, 10, 30) + _scalar_weight(ffd, a, b, 80, 15) for a, b in indices]
+        assert np.allclose(w, expected)
+
+    def test_04_data_db(self):
+        data = SolutionData.__new__(SolutionData)
+        data.active_expression = "S(1,1)"
+        values = [1.0, 0.5, 2e-3, 3.0]
+        with unittest.mock.patch.object(SolutionData, "data_magnitude", return_value=values) as data_magnitude:
+            assert data.data_db10() == [db10(i) for i in values]
+            assert data.data_db20("S(2,1)", True) == [db20(i) for i in values]
+            data_magnitude.assert_called_with("S(2,1)", True)
+            assert data.data_db() == data.data_db10()
+            data_magnitude.assert_called_with("S(1,1)", False)
+
+    def test_05_solution_data_sweeps(self):
+        data = SolutionData([_VariationData(1.0), _VariationData(2.0)])
+        assert data.expressions == ["S(1,1)", "V1"]
+        assert data.intrinsics == OrderedDict([("Freq", [1.0, 2.0, 3.0]), ("Phi", [0.0, 90.0])])
+        assert data.primary_sweep == "Freq"
+        assert data.primary_sweep_values == [1.0, 2.0, 3.0]
+        assert data.variation_values("x") == [1.0, 2.0]
+        assert data.units_sweeps == {"Freq": "GHz", "Phi": "deg"}
+        assert data.units_data == {"S(1,1)": "", "V1": "mV"}
+        assert data.primary_sweep_variations == [
+            OrderedDict([("x", 1.0), ("Freq", f), ("Phi", 0.0)]) for f in [1.0, 2.0, 3.0]
+        ]
+
+    def test_06_solution_data_values(self):
+        data = SolutionData([_VariationData(1.0), _VariationData(2.0)])
+        assert np.allclose(data.data_real(), [0.1, 0.2, 0.3])
+        assert np.allclose(data.data_imag(), [-0.2, -0.4, -0.6])
+        assert np.allclose(data.data_magnitude(), [math.hypot(0.1 * f, 0.2 * f) for f in [1, 2, 3]])
+        assert np.allclose(data.data_phase(radians=False), [math.degrees(math.atan(-2))] * 3)
+        assert data.data_real("V1") == [100.0, 200.0, 300.0]
+        assert np.allclose(data.data_real("V1", True), [0.1, 0.2, 0.3])
+        assert data.data_imag("V1") == [0, 0, 0]
+        assert data.data_real("Unknown") is False
+        assert not data.is_real_only()
+        assert data.is_real_only("V1")
+
+        data.active_intrinsic["Phi"] = 90.0
+        assert data.data_real("V1") == [190.0, 290.0, 390.0]
+        assert data.set_active_variation(1)
+        assert data.data_real("V1") == [290.0, 490.0, 690.0]
+        assert np.allclose(data.data_magnitude(), [math.hypot(0.2 * f + 0.9, 0.4 * f) for f in [1, 2, 3]])
+        assert not data.set_active_variation(2)
+
+    def test_07_solution_data_primary_sweep(self):
+        data = SolutionData([_VariationData(1.0)])
+        data.primary_sweep = "Phi"
+        assert data.primary_sweep_values == [0.0, 90.0]
+        assert data.data_real("V1") == [100.0, 190.0]
+        data.primary_sweep = "Unknown"
+        assert data.primary_sweep == "Phi"
+
+    def test_08_solution_data_export_csv(self, tmp_path):
+        data = SolutionData([_VariationData(1.0), _VariationData(2.0)])
+        output = str(tmp_path / "data.csv")
+        assert data.export_data_to_csv(output)
+        with open(output) as f:
+            rows = [line.strip().split(";") for line in f if line.strip()]
+        assert rows[0] == ["x", "Freq", "Phi", "S(1,1) (Real)", "S(1,1) (Imag)", "V1"]
+        assert len(rows) == 13
+        assert [float(i) for i in rows[-1]] == pytest.approx([2.0, 3.0, 90.0, 1.5, -1.2, 690.0])
+
+    def test_09_field_plot_geometry(self):
+        plot = FieldPlot(_field_postprocessor(), surfacelist=[FacePrimitive(None, 5), 6, 99, 7])
+        assert plot.plotGeomInfo == [1, "Surface", "FacesList", 2, "5", "7", "NonModelFaceList", 1, "6"]
+        plot = FieldPlot(
+            _field_postprocessor(), objlist=["Box1"], surfacelist=[6], linelist=["Line1"], cutplanelist=["Global:XY"]
+        )
+        assert plot.plotGeomInfo == [
+            4,
+            "Volume",
+            "ObjList",
+            1,
+            "Box1",
+            "Surface",
+            "NonModelFaceList",
+            1,
+            "6",
+            "Surface",
+            "CutPlane",
+            1,
+            "Global:XY",
+            "Line",
+            1,
+            "Line1",
+        ]
+        assert plot.surfacePlotInstruction[19:21] == ["PlotGeomInfo:=", plot.plotGeomInfo]
+        assert plot.surfacePlotInstruction[23][0] == "NAME:PlotOnSurfaceSettings"
+        plot = FieldPlot(_field_postprocessor(), objlist=["Box1", "Box2"])
+        assert plot.plotGeomInfo == [1, "Volume", "ObjList", 2, "Box1", "Box2"]
+        assert plot.surfacePlotInstruction[23][0] == "NAME:PlotOnVolumeSettings"
+
+    def test_10_field_plot_intrinsics(self):
+        plot = FieldPlot(_field_postprocessor(), objlist=["Box1"], intrinsincList={"Freq": "1GHz", "Phase": "0deg"})
+        assert plot.intrinsicVar == "Freq='1GHz' Phase='0deg' "
+        plot.intrinsincList = ["Freq:=", ["1GHz"], "Phase:=", "10deg"]
+        assert plot.intrinsicVar == "Freq='1GHz' Phase='10deg' "
+        plot.intrinsincList = {}
+        assert plot.intrinsicVar == ""
+
+    def test_11_unit_quantities(self):
+        for quantity, units in AEDT_UNITS.items():
+            for unit in list(units) + [unit.upper() for unit in units]:
+                expected = next(q for q in AEDT_UNITS if unit.lower() in [u.lower() for u in AEDT_UNITS[q]])
+                assert SolutionData._quantity(unit) == expected
+        assert SolutionData._quantity("GHz") == "Freq"
+        assert SolutionData._quantity("") == "None"
+        assert SolutionData._quantity("unknown") is None
+
+    def test_12_beamform(self):
+        ffd = _array_data()
+        qtys = ffd.beamform(phi_scan=20, theta_scan=30)
+        weights = [_scalar_weight(ffd, a - 1, b - 1, 20, 30) for a in range(1, 4) for b in range(1, 3)]
+        for key, value in _reference_beamform(ffd, weights).items():
+            assert np.allclose(qtys[key], value)
+        assert np.allclose(qtys["RealizedGain_dB"], 10 * np.log10(qtys["RealizedGain"]))
+        assert ffd.max_gain == np.max(qtys["RealizedGain_dB"])
+        assert (qtys["nTheta"], qtys["nPhi"]) == (4, 5)
+        assert np.allclose(qtys["Element_Location"]["Port[3,2]"], ffd.element_location(2, 1))
+
+    def test_13_beamform_two_beams(self):
+        ffd = _array_data()
+        qtys = ffd.beamform_2beams(phi_scan1=20, theta_scan1=30, phi_scan2=-40, theta_scan2=10)
+        weights = [
+            _scalar_weight(ffd, a, b, 20, 30) + _scalar_weight(ffd, a, b, -40, 10)
+            for a in range(1, 4)
+            for b in range(1, 3)
+        ]
+        for key, value in _reference_beamform(ffd, weights).items():
+            assert np.allclose(qtys[key], value)
+        assert np.allclose(qtys["Element_Location"]["Port[3,2]"], ffd.element_location(3, 2))
+
+    def test_14_angle_conversions(self):
+        angles = [-math.pi, 0, math.pi / 4, math.pi / 2, 2 * math.pi]
+        degrees = SolutionData.to_degrees(angles)
+        assert isinstance(degrees, list)
+        assert np.allclose(degrees, [-180, 0, 45, 90, 360])
+        radians = SolutionData.to_radians(degrees)
+        assert isinstance(radians, list)
+        assert np.allclose(radians, angles)
+        assert SolutionData.to_degrees([]) == SolutionData.to_radians([]) == []
@@ -373,8 +373,9 @@ class Analysis(Design, object):
         >>> oModule.GelAllSolutionNames
         >>> oModule.GetSweeps
         """
-        if len(self.existing_analysis_sweeps) > 0:
-            return self.existing_analysis_sweeps[0]
+        sweeps = self.existing_analysis_sweeps
+        if len(sweeps) > 0:
+            return sweeps[0]
         else:
             return ""
 
@@ -394,11 +395,13 @@ class Analysis(Design, object):
         >>> oModule.GelAllSolutionNames
         >>> oModule.GetSweeps
         """
-
-        if len(self.existing_analysis_sweeps) > 1:
-            return self.existing_analysis_sweeps[1]
+        sweeps = self.existing_analysis_sweeps
+        if len(sweeps) > 1:
+            return sweeps[1]
+        elif sweeps:
+            return sweeps[0]
         else:
-            return self.nominal_adaptive
+            return ""
 
     @property
     def existing_analysis_setups(self):
@@ -566,9 +569,16 @@ class Analysis(Design, object):
         bool
             ``True`` when simulation is finished.
         """
+        self._clear_post_cache()
         self.odesign.AnalyzeAll()
         return True
 
+    @pyaedt_function_handler()
+    def _clear_post_cache(self):
+        """Clear postprocessing data cached from previous solutions."""
+        if hasattr(self._post, "_clear_aedtplt_cache"):
+            self._post._clear_aedtplt_cache()
+
     @pyaedt_function_handler()
     def list_of_variations(self, setup_name=None, sweep_name=None):
         """Retrieve a list of active variations for input setup.
@@ -1473,6 +1483,7 @@ class Analysis(Design, object):
 
         >>> oDesign.Analyze
         """
+        self._clear_post_cache()
         set_custom_dso = False
         active_config = self._desktop.GetRegistryString(r"Desktop/ActiveDSOConfigurations/" + self.design_type)
         if acf_file:
@@ -1601,6 +1612,7 @@ class Analysis(Design, object):
         dont have old .asol files etc
         """
 
+        self._clear_post_cache()
         self.logger.info("Solving model in batch mode on " + machine)
         self.logger.info("Batch Job command:" + batch_run)
         if run_in_thread:
@@ -161,6 +161,7 @@ class Design(AedtObjects):
         # Get Desktop from global Desktop Environment
         self._project_dictionary = OrderedDict()
         self._boundaries = []
+        self._oo_enabled = None
         self._project_datasets = {}
         self._design_datasets = {}
         main_module = sys.modules["__main__"]
@@ -1379,14 +1380,17 @@ class Design(AedtObjects):
     def _is_object_oriented_enabled(self):
         if self._aedt_version >= "2022.1":
             return True
-        elif self.check_beta_option_enabled("SF159726_SCRIPTOBJECT"):
-            return True
-        else:
-            try:
-                self.oproject.GetChildObject("Variables")
-                return True
-            except:
-                return False
+        # The check queries the desktop registry and the project, and its result cannot change in a session.
+        if self._oo_enabled is None:
+            if self.check_beta_option_enabled("SF159726_SCRIPTOBJECT"):
+                self._oo_enabled = True
+            else:
+                try:
+                    self.oproject.GetChildObject("Variables")
+                    self._oo_enabled = True
+                except:
+                    self._oo_enabled = False
+        return self._oo_enabled
 
     @pyaedt_function_handler()
     def set_active_dso_config_name(self, product_name="HFSS", config_name="Local"):
@@ -27,6 +27,9 @@ except ImportError:
     if os.name != "posix":
         warnings.warn("PythonNET is needed to run pyaedt")
 
+_ARG_SCALAR_TYPES = frozenset([str, int, float, bool])
+_ARG_PRIMITIVE_TYPES = frozenset([EdgePrimitive, FacePrimitive, VertexPrimitive])
+
 
 @pyaedt_function_handler()
 def _tuple2dict(t, d):
@@ -73,44 +76,54 @@ def _dict2arg(d, arg_out):
     Returns
     -------
 
+    """
+    _dict2arg_recursive(d, arg_out)
+
+
+def _dict2arg_recursive(d, arg_out):
+    """Append the AEDT arguments of a dictionary to a list.
+
+    Nested dictionaries are converted by direct recursion so that the function handler of
+    ``_dict2arg`` runs once per conversion and not once per nested dictionary.
+
+    Parameters
+    ----------
+    d : dict
+        Dictionary to convert.
+    arg_out : list
+        List to which the arguments are appended.
     """
     for k, v in d.items():
         if "_pyaedt" in k:
             continue
+        t = type(v)
         if k == "Point" or k == "DimUnits":
             if isinstance(v[0], (list, tuple)):
-                for e in v:
-                    arg = ["NAME:" + k, e[0], e[1]]
-                    arg_out.append(arg)
+                arg_out.extend(["NAME:" + k, e[0], e[1]] for e in v)
             else:
-                arg = ["NAME:" + k, v[0], v[1]]
-                arg_out.append(arg)
+                arg_out.append(["NAME:" + k, v[0], v[1]])
         elif k == "Range":
             if isinstance(v[0], (list, tuple)):
                 for e in v:
-                    arg_out.append(k + ":=")
-                    arg_out.append([i for i in e])
+                    arg_out.extend((k + ":=", list(e)))
             else:
-                arg_out.append(k + ":=")
-                arg_out.append([i for i in v])
+                arg_out.extend((k + ":=", list(v)))
+        elif t in _ARG_SCALAR_TYPES:
+            arg_out.extend((k + ":=", v))
         elif isinstance(v, (OrderedDict, dict)):
             arg = ["NAME:" + k]
-            _dict2arg(v, arg)
+            _dict2arg_recursive(v, arg)
             arg_out.append(arg)
         elif v is None:
             arg_out.append(["NAME:" + k])
-        elif type(v) is list and len(v) > 0 and isinstance(v[0], (OrderedDict, dict)):
+        elif t is list and len(v) > 0 and isinstance(v[0], (OrderedDict, dict)):
             for el in v:
                 arg = ["NAME:" + k]
-                _dict2arg(el, arg)
+                _dict2arg_recursive(el, arg)
                 arg_out.append(arg)
 
         else:
-            arg_out.append(k + ":=")
-            if type(v) is EdgePrimitive or type(v) is FacePrimitive or type(v) is VertexPrimitive:
-                arg_out.append(v.id)
-            else:
-                arg_out.append(v)
+            arg_out.extend((k + ":=", v.id if t in _ARG_PRIMITIVE_TYPES else v))
 
 
 @pyaedt_function_handler()
@@ -870,6 +870,8 @@ def grpc_active_sessions(version=None, student_version=False, non_graphical=Fals
 
 
 class PropsManager(object):
+    __slots__ = ()
+
     def __getitem__(self, item):
         """Get the `self.props` key value.
 
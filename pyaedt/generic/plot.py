@@ -1,6 +1,7 @@
 import ast
 import csv
 import os
+import shutil
 import tempfile
 import time
 import warnings
@@ -13,6 +14,7 @@ from pyaedt.generic.constants import CSS4_COLORS
 from pyaedt.generic.general_methods import convert_remote_object
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
+from pyaedt.generic.general_methods import settings
 
 if not is_ironpython:
     try:
@@ -23,32 +25,10 @@ if not is_ironpython:
             "Install with \n\npip install numpy\n\nRequires CPython."
         )
 
-    try:
-        import pyvista as pv
-
-        pyvista_available = True
-    except ImportError:
-        warnings.warn(
-            "The PyVista module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install pyvista\n\nRequires CPython."
-        )
-
-    try:
-        import matplotlib.pyplot as plt
-        from matplotlib.patches import PathPatch
-        from matplotlib.path import Path
-
-    except ImportError:
-        warnings.warn(
-            "The Matplotlib module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install matplotlib\n\nRequires CPython."
-        )
-    except:
-        pass
-
 
 @pyaedt_function_handler()
 def get_structured_mesh(theta, phi, ff_data):
+    import pyvista as pv
 
     if ff_data.min() < 0:
         ff_data_renorm = ff_data + np.abs(ff_data.min())
@@ -316,6 +296,8 @@ def plot_polar_chart(
     snapshot_path : str
         Full path to image file if a snapshot is needed.
     """
+    import matplotlib.pyplot as plt
+
     dpi = 100.0
 
     ax = plt.subplot(111, projection="polar")
@@ -354,6 +336,30 @@ def plot_polar_chart(
     return fig
 
 
+def _decimation_indices(size, stride):
+    """Get the indices kept when decimating an axis, always including the last one.
+
+    Keeping the last index closes the surface of periodic sweeps, such as a 0 to 360 degrees
+    radiation pattern, whatever the stride.
+
+    Parameters
+    ----------
+    size : int
+        Number of points on the axis.
+    stride : int
+        Decimation step.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Indices of the points to keep.
+    """
+    indices = np.arange(0, size, stride)
+    if size and indices[-1] != size - 1:
+        indices = np.append(indices, size - 1)
+    return indices
+
+
 @pyaedt_function_handler()
 def plot_3d_chart(plot_data, size=(2000, 1000), xlabel="", ylabel="", title="", snapshot_path=None):
     """Create a matplotlib 3D plot based on a list of data.
@@ -379,6 +385,8 @@ def plot_3d_chart(plot_data, size=(2000, 1000), xlabel="", ylabel="", title="",
     :class:`matplotlib.plt`
         Matplotlib fig object.
     """
+    import matplotlib.pyplot as plt
+
     dpi = 100.0
 
     ax = plt.subplot(111, projection="3d")
@@ -387,19 +395,30 @@ def plot_3d_chart(plot_data, size=(2000, 1000), xlabel="", ylabel="", title="",
         len(plot_data)
     except:
         plot_data = convert_remote_object(plot_data)
-    if isinstance(plot_data[0], np.ndarray):
-        x = plot_data[0]
-        y = plot_data[1]
-        z = plot_data[2]
+    # Single precision is enough for plotting and halves the data walked by the 3D projections.
+    # Dense grids are decimated up front: the polygon count drives the plot_surface rendering time.
+    # The last row and column are always kept so that closed surfaces do not show a seam.
+    # Only the points kept after the decimation are converted.
+    if isinstance(plot_data[0], np.ndarray) and plot_data[0].ndim > 1:
+        stride = max(1, int(np.sqrt(np.size(plot_data[0])) / 128))
+        rows = _decimation_indices(plot_data[0].shape[0], stride)
+        cols = _decimation_indices(plot_data[0].shape[1], stride)
+        x = np.asarray(plot_data[0])[np.ix_(rows, cols)].astype(np.float32)
+        y = np.asarray(plot_data[1])[np.ix_(rows, cols)].astype(np.float32)
+        z = np.asarray(plot_data[2])[np.ix_(rows, cols)].astype(np.float32)
     else:
-        theta_grid, phi_grid = np.meshgrid(plot_data[0], plot_data[1])
-        if isinstance(plot_data[2], list):
-            r = np.array(plot_data[2])
-        else:
-            r = plot_data[2]
-        x = r * np.sin(theta_grid) * np.cos(phi_grid)
-        y = r * np.sin(theta_grid) * np.sin(phi_grid)
-        z = r * np.cos(theta_grid)
+        r = np.asarray(plot_data[2])
+        stride = max(1, int(np.sqrt(r.size) / 128))
+        rows = _decimation_indices(r.shape[0], stride)
+        cols = _decimation_indices(r.shape[1], stride)
+        r = r[np.ix_(rows, cols)].astype(np.float32)
+        theta = np.asarray(plot_data[0])[cols].astype(np.float32)
+        phi = np.asarray(plot_data[1])[rows].astype(np.float32)
+        # Trigonometric terms are computed on the 1D sweeps and broadcast to the (phi, theta) grid.
+        x = r * np.sin(theta)[np.newaxis, :]
+        y = x * np.sin(phi)[:, np.newaxis]
+        x *= np.cos(phi)[:, np.newaxis]
+        z = r * np.cos(theta)[np.newaxis, :]
     ax.set(xlabel=xlabel, ylabel=ylabel, title=title)
     ax.plot_surface(x, y, z, rstride=1, cstride=1, cmap=plt.get_cmap("jet"), linewidth=0, antialiased=True, alpha=0.8)
     fig = plt.gcf()
@@ -438,6 +457,8 @@ def plot_2d_chart(plot_data, size=(2000, 1000), show_legend=True, xlabel="", yla
     :class:`matplotlib.plt`
         Matplotlib fig object.
     """
+    import matplotlib.pyplot as plt
+
     dpi = 100.0
     figsize = (size[0] / dpi, size[1] / dpi)
     fig, ax = plt.subplots(figsize=figsize)
@@ -498,6 +519,10 @@ def plot_matplotlib(plot_data, size=(2000, 1000), show_legend=True, xlabel="", y
     :class:`matplotlib.plt`
         Matplotlib fig object.
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import PathPatch
+    from matplotlib.path import Path
+
     dpi = 100.0
     figsize = (size[0] / dpi, size[1] / dpi)
     fig, ax = plt.subplots(figsize=figsize)
@@ -553,17 +578,19 @@ def plot_contour(qty_to_plot, x, y, size=(2000, 1600), xlabel="", ylabel="", tit
     :class:`matplotlib.plt`
         Matplotlib fig object.
     """
+    import matplotlib.pyplot as plt
+
     dpi = 100.0
     figsize = (size[0] / dpi, size[1] / dpi)
     fig, ax = plt.subplots(figsize=figsize)
     if title:
-        plt.title(title)
+        ax.set_title(title)
     if xlabel:
-        plt.xlabel(xlabel)
+        ax.set_xlabel(xlabel)
     if ylabel:
-        plt.ylabel(ylabel)
+        ax.set_ylabel(ylabel)
 
-    plt.contourf(
+    contour = ax.contourf(
         x,
         y,
         qty_to_plot.T,
@@ -571,12 +598,12 @@ def plot_contour(qty_to_plot, x, y, size=(2000, 1600), xlabel="", ylabel="", tit
         cmap="jet",
     )
 
-    plt.colorbar()
+    fig.colorbar(contour, ax=ax)
     if snapshot_path:
-        plt.savefig(snapshot_path)
+        fig.savefig(snapshot_path)
     else:
         plt.show()
-    return plt
+    return fig
 
 
 class ObjClass(object):
@@ -732,6 +759,7 @@ class ModelPlotter(object):
         self.color_bar = True
         self.array_coordinates = []
         self.meshes = None
+        self.temp_folder = None
 
     @property
     def isometric_view(self):
@@ -1141,6 +1169,8 @@ class ModelPlotter(object):
         -------
         bool
         """
+        import pyvista as pv
+
         self._fields.append(
             FieldClass(
                 None, log_scale, coordinate_units, opacity, color_map, label_name, surface_mapping_tolerance, show_edges
@@ -1154,6 +1184,8 @@ class ModelPlotter(object):
 
     @pyaedt_function_handler()
     def _read_mesh_files(self, read_frames=False):
+        import pyvista as pv
+
         for cad in self.objects:
             if not cad._cached_polydata:
                 filedata = pv.read(cad.path)
@@ -1358,6 +1390,8 @@ class ModelPlotter(object):
         -------
         bool
         """
+        import pyvista as pv
+
         start = time.time()
         self.pv = pv.Plotter(notebook=self.is_notebook, off_screen=self.off_screen, window_size=self.windows_size)
         self.meshes = None
@@ -1494,6 +1528,9 @@ class ModelPlotter(object):
                 if clean_cache:
                     el._cached_mesh = None
                     el._cached_polydata = None
+        if remove_objs and self.temp_folder and os.path.isdir(self.temp_folder):
+            shutil.rmtree(self.temp_folder, ignore_errors=True)
+            self.temp_folder = None
         return True
 
     @pyaedt_function_handler()
@@ -1504,6 +1541,8 @@ class ModelPlotter(object):
         -------
         bool
         """
+        import pyvista as pv
+
         start = time.time()
         assert len(self.frames) > 0, "Number of Fields have to be greater than 1 to do an animation."
         if self.is_notebook:
@@ -1594,17 +1633,16 @@ class ModelPlotter(object):
 
         cpos = self.pv.show(interactive=False, auto_close=False, interactive_update=not self.off_screen)
 
+        frame_scalars = [el._cached_polydata.point_data[el.label] for el in self.frames]
         if self.range_min is not None and self.range_max is not None:
             mins = self.range_min
             maxs = self.range_max
         else:
             mins = 1e20
             maxs = -1e20
-            for el in self.frames:
-                if np.min(el._cached_polydata.point_data[el.label]) < mins:
-                    mins = np.min(el._cached_polydata.point_data[el.label])
-                if np.max(el._cached_polydata.point_data[el.label]) > maxs:
-                    maxs = np.max(el._cached_polydata.point_data[el.label])
+            for scalars in frame_scalars:
+                mins = min(mins, np.min(scalars))
+                maxs = max(maxs, np.max(scalars))
 
         self.frames[0]._cached_mesh = self.pv.add_mesh(
             self.frames[0]._cached_polydata,
@@ -1619,8 +1657,6 @@ class ModelPlotter(object):
             name="FieldPlot",
             opacity=self.frames[0].opacity,
         )
-        start = time.time()
-
         self.pv.update(1, force_redraw=True)
         if self.gif_file:
             first_loop = True
@@ -1628,10 +1664,37 @@ class ModelPlotter(object):
         else:
             first_loop = False
         i = 1
+        frame_per_seconds = self.frame_per_seconds
+        if not frame_per_seconds or frame_per_seconds <= 0:
+            settings.logger.warning(
+                "Invalid frame rate {}. The animation uses 3 frames per second.".format(frame_per_seconds)
+            )
+            frame_per_seconds = 3
+        frame_interval = 1.0 / frame_per_seconds
+        if not (self.off_screen or self.is_notebook or self.gif_file):
+            # Let the VTK event loop pace the frames. Python is only entered in the timer callback.
+            self._frame_scalars = frame_scalars
+            self._i = i
+            iren = getattr(self.pv.iren, "interactor", self.pv.iren)
+            iren.Initialize()
+            timer_interval = int(1000 * frame_interval)
+            if timer_interval < 1:
+                settings.logger.warning(
+                    "Frame rate {} is above 1000 frames per second. The animation timer is limited to 1 ms.".format(
+                        frame_per_seconds
+                    )
+                )
+                timer_interval = 1
+            self._timer_id = iren.CreateRepeatingTimer(timer_interval)
+            iren.AddObserver("TimerEvent", self._on_tick)
+            iren.Start()
+            self._animating = False
+        next_frame_time = time.perf_counter() + frame_interval
         while self._animating:
             if self._pause:
                 time.sleep(1)
                 self.pv.update(1, force_redraw=True)
+                next_frame_time = time.perf_counter() + frame_interval
                 continue
             # p.remove_actor("FieldPlot")
             if i >= len(self.frames):
@@ -1639,12 +1702,14 @@ class ModelPlotter(object):
                     break
                 i = 0
                 first_loop = False
-            scalars = self.frames[i]._cached_polydata.point_data[self.frames[i].label]
-            self.pv.update_scalars(scalars, render=False)
+            self.pv.update_scalars(frame_scalars[i], render=False)
             if not hasattr(self.pv, "ren_win"):
                 break
-            time.sleep(max(0, (1 / self.frame_per_seconds) - (time.time() - start)))
-            start = time.time()
+            # Pace frames against a running deadline so that the drift does not accumulate.
+            sleep_time = next_frame_time - time.perf_counter()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            next_frame_time += frame_interval
             if self.off_screen:
                 self.pv.render()
             else:
@@ -1658,6 +1723,28 @@ class ModelPlotter(object):
         else:
             return True
 
+    def _on_tick(self, caller, event):
+        """Advance the animation by one frame on each VTK timer event.
+
+        Parameters
+        ----------
+        caller : vtkRenderWindowInteractor
+            Interactor that fired the timer event.
+        event : str
+            Name of the event.
+        """
+        if not self._animating or not hasattr(self.pv, "ren_win"):
+            caller.DestroyTimer(self._timer_id)
+            caller.TerminateApp()
+            return
+        if self._pause:
+            return
+        if self._i >= len(self._frame_scalars):
+            self._i = 0
+        self.pv.update_scalars(self._frame_scalars[self._i], render=False)
+        self.pv.render()
+        self._i += 1
+
     @pyaedt_function_handler()
     def generate_geometry_mesh(self):
         """Generate mesh for objects only.
@@ -1666,6 +1753,8 @@ class ModelPlotter(object):
         -------
         Mesh
         """
+        import pyvista as pv
+
         self.pv = pv.Plotter(notebook=self.is_notebook, off_screen=self.off_screen, window_size=self.windows_size)
         self._read_mesh_files()
         if self.array_coordinates:
@@ -5,6 +5,7 @@ from __future__ import absolute_import  # noreorder
 import csv
 import math
 import os
+import random
 import re
 from collections import OrderedDict
 
@@ -18,7 +19,6 @@ else:
 from pyaedt import settings
 from pyaedt.application.Analysis3D import FieldAnalysis3D
 from pyaedt.generic.DataHandlers import _arg2dict
-from pyaedt.generic.DataHandlers import random_string
 from pyaedt.generic.general_methods import generate_unique_name
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
@@ -2093,8 +2093,7 @@ class Icepak(FieldAnalysis3D):
                 "DesignDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict()}),
                 "MaterialDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict()}),
                 "MapInstanceParameters": "DesignVariable",
-                "UniqueDefinitionIdentifier": "57c8ab4e-4db9-4881-b6bb-"
-                + random_string(12, char_set="abcdef0123456789"),
+                "UniqueDefinitionIdentifier": "57c8ab4e-4db9-4881-b6bb-" + "%012x" % random.getrandbits(48),
                 "OriginFilePath": "",
                 "IsLocal": False,
                 "ChecksumString": "",
@@ -1141,6 +1141,7 @@ class GeometryModeler(Modeler, object):
         # TODO Refactor this as a dictionary with names as key
         self._coordinate_systems = None
         self._user_lists = None
+        self._model_units = None
         self._is3d = is3d
 
     @property
@@ -1386,12 +1387,31 @@ class GeometryModeler(Modeler, object):
         >>> oEditor.GetModelUnits
         >>> oEditor.SetModelUnits
         """
-        return _retry_ntimes(10, self.oeditor.GetModelUnits)
+        if self._model_units is None:
+            self._model_units = _retry_ntimes(10, self.oeditor.GetModelUnits)
+        return self._model_units
 
     @model_units.setter
     def model_units(self, units):
         assert units in AEDT_UNITS["Length"], "Invalid units string {0}.".format(units)
         self.oeditor.SetModelUnits(["NAME:Units Parameter", "Units:=", units, "Rescale:=", False])
+        self.invalidate_cache()
+
+    @pyaedt_function_handler()
+    def invalidate_cache(self):
+        """Clear the model units cached from AEDT.
+
+        Call this method after the model units are changed outside of PyAEDT,
+        for example from the AEDT user interface or from another script, so that
+        the next access to ``model_units`` reads them from AEDT.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        self._model_units = None
+        return True
 
     @property
     def selections(self):
@@ -4251,6 +4271,7 @@ class GeometryModeler(Modeler, object):
         vArg1.append("SeparateDisjointLumps:="), vArg1.append(False)
         vArg1.append("SourceFile:="), vArg1.append(filename)
         self.oeditor.Import(vArg1)
+        self.invalidate_cache()
         if refresh_all_ids:
             self.refresh_all_ids()
         self.logger.info("Step file {} imported".format(filename))
@@ -8,11 +8,14 @@ from __future__ import absolute_import  # noreorder
 import os
 import time
 import warnings
+from collections import OrderedDict
 
+from pyaedt import settings
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
 from pyaedt.generic.plot import ModelPlotter
+from pyaedt.modules.PostProcessor import _TEMPORARY_PLOTS_CACHE_KEY
 from pyaedt.modules.PostProcessor import PostProcessor as Post
 
 if not is_ironpython:
@@ -24,12 +27,26 @@ if not is_ironpython:
             "Install with \n\npip install numpy\n\nRequires CPython."
         )
 
-    try:
-        from IPython.display import Image
 
-        ipython_available = True
-    except ImportError:
-        ipython_available = False
+def _sweep_range(values):
+    """Get the uniformly spaced range spanned by the values of a sweep.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Sweep values.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted unique values when they are already uniformly spaced, otherwise
+        a linear range between their minimum and maximum with the same number of points.
+    """
+    unique_values = np.unique(values)
+    steps = np.diff(unique_values)
+    if steps.size == 0 or np.allclose(steps, steps[0]):
+        return unique_values
+    return np.linspace(unique_values[0], unique_values[-1], unique_values.size)
 
 
 class PostProcessor(Post):
@@ -74,11 +91,32 @@ class PostProcessor(Post):
             Jupyter notebook image.
 
         """
-        if ipython_available:
-            file_name = self.export_model_picture(show_axis=show_axis, show_grid=show_grid, show_ruler=show_ruler)
-            return Image(file_name, width=500)
-        else:
+        try:
+            from IPython.display import Image
+        except ImportError:
             warnings.warn("The Ipython package is missing and must be installed.")
+            return
+        file_name = self.export_model_picture(show_axis=show_axis, show_grid=show_grid, show_ruler=show_ruler)
+        return Image(file_name, width=500)
+
+    @pyaedt_function_handler()
+    def _get_cached_frames(self, cache_key):
+        """Get the field files previously exported for an animation.
+
+        Parameters
+        ----------
+        cache_key : tuple
+            Key identifying the field plot and the variations exported.
+
+        Returns
+        -------
+        list
+            List of the cached files. The list is empty if no valid files are cached.
+        """
+        files = self._aedtplt_cache.get(cache_key, [])
+        if files and all(file and os.path.exists(file) for file in files):
+            return list(files)
+        return []
 
     @pyaedt_function_handler()
     def get_efields_data(self, setup_sweep_name="", ff_setup="Infinite Sphere1", freq="All"):
@@ -105,56 +143,41 @@ class PostProcessor(Post):
         """
         if not setup_sweep_name:
             setup_sweep_name = self._app.nominal_adaptive
-        results_dict = {}
         all_sources = self.post_osolution.GetAllSources()
         # assuming only 1 mode
         all_sources_with_modes = [s + ":1" for s in all_sources]
+        results_dict = OrderedDict.fromkeys(all_sources)
+        theta_range = phi_range = None
+
+        header = ["IncludePortPostProcessing:=", False, "SpecifySystemPower:=", False]
+        templates = [["Name:=", each, "Magnitude:=", "0W", "Phase:=", "0deg"] for each in all_sources_with_modes]
 
         for n, source in enumerate(all_sources_with_modes):
-            edit_sources_ctxt = [["IncludePortPostProcessing:=", False, "SpecifySystemPower:=", False]]
-            for m, each in enumerate(all_sources_with_modes):
-                if n == m:  # set only 1 source to 1W, all the rest to 0
-                    mag = 1
-                else:
-                    mag = 0
-                phase = 0
-                edit_sources_ctxt.append(
-                    ["Name:=", "{}".format(each), "Magnitude:=", "{}W".format(mag), "Phase:=", "{}deg".format(phase)]
-                )
+            # set only 1 source to 1W, all the rest to 0
+            templates[n][3] = "1W"
+            edit_sources_ctxt = [header] + templates
             self.post_osolution.EditSources(edit_sources_ctxt)
+            templates[n][3] = "0W"
 
-            ctxt = ["Context:=", ff_setup]
-
-            sweeps = ["Theta:=", ["All"], "Phi:=", ["All"], "Freq:=", [freq]]
-
-            trace_name = "rETheta"
+            # rETheta and rEPhi are retrieved in a single request
             solnData = self.get_far_field_data(
-                setup_sweep_name=setup_sweep_name, domain=ff_setup, expression=trace_name
+                setup_sweep_name=setup_sweep_name, domain=ff_setup, expression=["rETheta", "rEPhi"]
             )
-
             data = solnData.nominal_variation
 
-            theta_vals = np.degrees(np.array(data.GetSweepValues("Theta")))
-            phi_vals = np.degrees(np.array(data.GetSweepValues("Phi")))
-            # phi is outer loop
-            theta_unique = np.unique(theta_vals)
-            phi_unique = np.unique(phi_vals)
-            theta_range = np.linspace(np.min(theta_vals), np.max(theta_vals), np.size(theta_unique))
-            phi_range = np.linspace(np.min(phi_vals), np.max(phi_vals), np.size(phi_unique))
-            real_theta = np.array(data.GetRealDataValues(trace_name))
-            imag_theta = np.array(data.GetImagDataValues(trace_name))
-
-            trace_name = "rEPhi"
-            solnData = self.get_far_field_data(
-                setup_sweep_name=setup_sweep_name, domain=ff_setup, expression=trace_name
-            )
-            data = solnData.nominal_variation
+            if theta_range is None:
+                # Sweep values do not depend on the excitation, so they are computed only once.
+                # phi is outer loop
+                theta_range = _sweep_range(np.rad2deg(data.GetSweepValues("Theta")))
+                phi_range = _sweep_range(np.rad2deg(data.GetSweepValues("Phi")))
 
-            real_phi = np.array(data.GetRealDataValues(trace_name))
-            imag_phi = np.array(data.GetImagDataValues(trace_name))
+            real_theta = np.array(data.GetRealDataValues("rETheta"))
+            imag_theta = np.array(data.GetImagDataValues("rETheta"))
+            real_phi = np.array(data.GetRealDataValues("rEPhi"))
+            imag_phi = np.array(data.GetImagDataValues("rEPhi"))
 
-            Etheta = np.vectorize(complex)(real_theta, imag_theta)
-            Ephi = np.vectorize(complex)(real_phi, imag_phi)
+            Etheta = real_theta + 1j * imag_theta
+            Ephi = real_phi + 1j * imag_phi
             source_name_without_mode = source.replace(":1", "")
             results_dict[source_name_without_mode] = [theta_range, phi_range, Etheta, Ephi]
         return results_dict
@@ -168,6 +191,7 @@ class PostProcessor(Post):
         force_opacity_value=None,
         array_coordinates=None,
         generate_mesh=True,
+        use_tempdir=False,
     ):
         """Initialize the Model Plotter object with actual modeler objects and return it.
 
@@ -185,6 +209,11 @@ class PostProcessor(Post):
         array_coordinates : list of list
             List of array element centers. The modeler objects will be duplicated and translated.
             List of [[x1,y1,z1], [x2,y2,z2]...].
+        generate_mesh : bool, optional
+            Generate the geometry mesh after the export. The default is ``True``.
+        use_tempdir : bool, optional
+            Export the obj files into a temporary directory that is removed by
+            ``ModelPlotter.clean_cache_and_files``. The default is ``False``.
 
          Returns
          -------
@@ -196,6 +225,7 @@ class PostProcessor(Post):
             obj_list=objects,
             export_as_single_objects=plot_as_separate_objects,
             air_objects=plot_air_objects,
+            use_tempdir=use_tempdir,
         )
         if not files:
             self.logger.warning("No Objects exported. Try other options or include Air objects.")
@@ -203,6 +233,8 @@ class PostProcessor(Post):
 
         model = ModelPlotter()
         model.off_screen = True
+        if use_tempdir and not settings.remote_rpc_session:
+            model.temp_folder = os.path.dirname(files[0][0])
         for file in files:
             if force_opacity_value:
                 model.add_object(file[0], file[1], force_opacity_value, self.modeler.model_units)
@@ -261,6 +293,7 @@ class PostProcessor(Post):
             force_opacity_value=force_opacity_value,
             array_coordinates=array_coordinates,
             generate_mesh=False,
+            use_tempdir=clean_files,
         )
 
         model.off_screen = not show
@@ -362,6 +395,7 @@ class PostProcessor(Post):
         project_path="",
         export_gif=False,
         show=True,
+        use_cache=False,
     ):
         """Generate a field plot to an image file (JPG or PNG) using PyVista.
 
@@ -389,6 +423,11 @@ class PostProcessor(Post):
                 show=False,
         show : bool, optional
              Generate the animation without showing an interactive plot.  The default is ``True``.
+        use_cache : bool, optional
+            Whether to reuse the frames exported by a previous call with the same arguments.
+            The cache is cleared when the plot is updated or deleted and when the design is
+            analyzed, but not when variables or geometry change, in which case the frames
+            can be stale. The default is ``False``.
 
         Returns
         -------
@@ -400,23 +439,30 @@ class PostProcessor(Post):
         else:
             self.ofieldsreporter.UpdateQuantityFieldsPlots(plot_folder)
 
-        fields_to_add = []
         if not project_path:
             project_path = self._app.working_directory
-        for el in variation_list:
-            self._app._odesign.ChangeProperty(
-                [
-                    "NAME:AllTabs",
-                    [
-                        "NAME:FieldsPostProcessorTab",
-                        ["NAME:PropServers", "FieldsReporter:" + plotname],
-                        ["NAME:ChangedProps", ["NAME:" + variation_variable, "Value:=", el]],
-                    ],
-                ]
-            )
-            fields_to_add.append(
-                self.export_field_plot(plotname, project_path, plotname + variation_variable + str(el))
-            )
+        cache_key = (plotname, variation_variable, tuple(variation_list), project_path)
+        fields_to_add = self._get_cached_frames(cache_key) if use_cache else []
+        # AEDT processes scripting calls sequentially, so the property arguments are built once
+        # and only the variation value is updated at each step.
+        changed_prop = ["NAME:" + variation_variable, "Value:=", None]
+        all_tabs = [
+            "NAME:AllTabs",
+            [
+                "NAME:FieldsPostProcessorTab",
+                ["NAME:PropServers", "FieldsReporter:" + plotname],
+                ["NAME:ChangedProps", changed_prop],
+            ],
+        ]
+        if not fields_to_add:
+            for el in variation_list:
+                changed_prop[2] = el
+                self._app._odesign.ChangeProperty(all_tabs)
+                file_to_add = self.export_field_plot(plotname, project_path, plotname + variation_variable + str(el))
+                if file_to_add:
+                    fields_to_add.append(file_to_add)
+            if len(fields_to_add) == len(variation_list):
+                self._aedtplt_cache[cache_key] = list(fields_to_add)
 
         model = self.get_model_plotter_geometries(generate_mesh=False)
         model.off_screen = not show
@@ -446,6 +492,7 @@ class PostProcessor(Post):
         export_gif=False,
         show=True,
         zoom=None,
+        use_cache=False,
     ):
         """Generate a field plot to an animated gif file using PyVista.
 
@@ -487,6 +534,10 @@ class PostProcessor(Post):
             Generate the animation without showing an interactive plot.  The default is ``True``.
         zoom : float, optional
             Zoom factor.
+        use_cache : bool, optional
+            Whether to reuse the frames exported by a previous call with the same arguments.
+            The cache is cleared when the design is analyzed, but not when variables or
+            geometry change, in which case the frames can be stale. The default is ``False``.
 
         Returns
         -------
@@ -496,22 +547,36 @@ class PostProcessor(Post):
         if not project_path:
             project_path = self._app.working_directory
 
-        v = 0
-        fields_to_add = []
-        for el in variation_list:
-            intrinsic_dict[variation_variable] = el
-            if plottype == "Surface":
-                plotf = self.create_fieldplot_surface(object_list, quantityname, setup_name, intrinsic_dict)
-            elif plottype == "Volume":
-                plotf = self.create_fieldplot_volume(object_list, quantityname, setup_name, intrinsic_dict)
-            else:
-                plotf = self.create_fieldplot_cutplane(object_list, quantityname, setup_name, intrinsic_dict)
-            if plotf:
-                file_to_add = self.export_field_plot(plotf.name, project_path, plotf.name + str(v))
-                if file_to_add:
-                    fields_to_add.append(file_to_add)
-                plotf.delete()
-            v += 1
+        cache_key = (
+            _TEMPORARY_PLOTS_CACHE_KEY,
+            quantityname,
+            str(object_list),
+            plottype,
+            setup_name,
+            str(sorted(intrinsic_dict.items())),
+            variation_variable,
+            tuple(variation_list),
+            project_path,
+        )
+        fields_to_add = self._get_cached_frames(cache_key) if use_cache else []
+        if not fields_to_add:
+            for v, el in enumerate(variation_list):
+                # Work on a copy so that the caller's dictionary (or the shared default) is never modified.
+                variation_dict = dict(intrinsic_dict)
+                variation_dict[variation_variable] = el
+                if plottype == "Surface":
+                    plotf = self.create_fieldplot_surface(object_list, quantityname, setup_name, variation_dict)
+                elif plottype == "Volume":
+                    plotf = self.create_fieldplot_volume(object_list, quantityname, setup_name, variation_dict)
+                else:
+                    plotf = self.create_fieldplot_cutplane(object_list, quantityname, setup_name, variation_dict)
+                if plotf:
+                    file_to_add = self.export_field_plot(plotf.name, project_path, plotf.name + str(v))
+                    if file_to_add:
+                        fields_to_add.append(file_to_add)
+                    plotf.delete()
+            if len(fields_to_add) == len(variation_list):
+                self._aedtplt_cache[cache_key] = list(fields_to_add)
         model = self.get_model_plotter_geometries(generate_mesh=False)
         model.off_screen = not show
 
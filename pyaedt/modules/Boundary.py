@@ -1,11 +1,12 @@
 """
 This module contains these classes: `BoundaryCommon` and `BoundaryObject`.
 """
+import random
+import sys
 from collections import OrderedDict
 
 from pyaedt.generic.constants import CATEGORIESQ3D
 from pyaedt.generic.DataHandlers import _dict2arg
-from pyaedt.generic.DataHandlers import random_string
 from pyaedt.generic.general_methods import PropsManager
 from pyaedt.generic.general_methods import filter_tuple
 from pyaedt.generic.general_methods import generate_unique_name
@@ -15,6 +16,11 @@ from pyaedt.modeler.Object3d import FacePrimitive
 from pyaedt.modeler.Object3d import VertexPrimitive
 from pyaedt.modeler.Object3d import _dim_arg
 
+if sys.version_info[0] >= 3:
+    from sys import intern
+
+_PRIMITIVE_TYPES = (EdgePrimitive, FacePrimitive, VertexPrimitive)
+
 
 class BoundaryProps(OrderedDict):
     """AEDT Boundary Component Internal Parameters."""
@@ -89,9 +95,7 @@ class BoundaryCommon(PropsManager):
             self._app.o_maxwell_parameters.DeleteParameters([self.name])
         else:
             self._app.oboundary.DeleteBoundaries([self.name])
-        for el in self._app.boundaries:
-            if el.name == self.name:
-                self._app.boundaries.remove(el)
+        self._app.boundaries[:] = [el for el in self._app.boundaries if el.name != self.name]
         return True
 
 
@@ -110,6 +114,19 @@ class NativeComponentObject(BoundaryCommon, object):
     >>> par_beam.delete()
     """
 
+    # Properties passed to the native component definition edit, in AEDT order.
+    _definition_keys = (
+        "GeometryDefinitionParameters",
+        "DesignDefinitionParameters",
+        "MaterialDefinitionParameters",
+        "NextUniqueID",
+        "MoveBackwards",
+        "DatasetType",
+        "DatasetDefinitions",
+        "NativeComponentDefinitionProvider",
+    )
+    _component_info_keys = ("ComponentName", "Company", "Model Number", "Help URL", "Version", "Notes", "IconType")
+
     def __init__(self, app, component_type, component_name, props):
         self.auto_update = False
         self._app = app
@@ -117,44 +134,37 @@ class NativeComponentObject(BoundaryCommon, object):
         self.component_name = component_name
         self.props = BoundaryProps(
             self,
-            OrderedDict(
-                {
-                    "TargetCS": "Global",
-                    "SubmodelDefinitionName": self.component_name,
-                    "ComponentPriorityLists": OrderedDict({}),
-                    "NextUniqueID": 0,
-                    "MoveBackwards": False,
-                    "DatasetType": "ComponentDatasetType",
-                    "DatasetDefinitions": OrderedDict({}),
-                    "BasicComponentInfo": OrderedDict(
-                        {
-                            "ComponentName": self.component_name,
-                            "Company": "",
-                            "Company URL": "",
-                            "Model Number": "",
-                            "Help URL": "",
-                            "Version": "1.0",
-                            "Notes": "",
-                            "IconType": "",
-                        }
-                    ),
-                    "GeometryDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict({})}),
-                    "DesignDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict({})}),
-                    "MaterialDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict({})}),
-                    "MapInstanceParameters": "DesignVariable",
-                    "UniqueDefinitionIdentifier": "89d26167-fb77-480e-a7ab-"
-                    + random_string(12, char_set="abcdef0123456789"),
-                    "OriginFilePath": "",
-                    "IsLocal": False,
-                    "ChecksumString": "",
-                    "ChecksumHistory": [],
-                    "VersionHistory": [],
-                    "NativeComponentDefinitionProvider": OrderedDict({"Type": component_type}),
-                    "InstanceParameters": OrderedDict(
-                        {"GeometryParameters": "", "MaterialParameters": "", "DesignParameters": ""}
-                    ),
-                }
-            ),
+            {
+                "TargetCS": "Global",
+                "SubmodelDefinitionName": self.component_name,
+                "ComponentPriorityLists": {},
+                "NextUniqueID": 0,
+                "MoveBackwards": False,
+                "DatasetType": "ComponentDatasetType",
+                "DatasetDefinitions": {},
+                "BasicComponentInfo": {
+                    "ComponentName": self.component_name,
+                    "Company": "",
+                    "Company URL": "",
+                    "Model Number": "",
+                    "Help URL": "",
+                    "Version": "1.0",
+                    "Notes": "",
+                    "IconType": "",
+                },
+                "GeometryDefinitionParameters": {"VariableOrders": {}},
+                "DesignDefinitionParameters": {"VariableOrders": {}},
+                "MaterialDefinitionParameters": {"VariableOrders": {}},
+                "MapInstanceParameters": "DesignVariable",
+                "UniqueDefinitionIdentifier": "89d26167-fb77-480e-a7ab-" + "%012x" % random.getrandbits(48),
+                "OriginFilePath": "",
+                "IsLocal": False,
+                "ChecksumString": "",
+                "ChecksumHistory": [],
+                "VersionHistory": [],
+                "NativeComponentDefinitionProvider": {"Type": component_type},
+                "InstanceParameters": {"GeometryParameters": "", "MaterialParameters": "", "DesignParameters": ""},
+            },
         )
         if props:
             self._update_props(self.props, props)
@@ -180,13 +190,16 @@ class NativeComponentObject(BoundaryCommon, object):
         self.props["TargetCS"] = cs
 
     def _update_props(self, d, u):
-        for k, v in u.items():
-            if isinstance(v, (dict, OrderedDict)):
-                if k not in d:
-                    d[k] = OrderedDict({})
-                d[k] = self._update_props(d[k], v)
-            else:
-                d[k] = v
+        stack = [(d, u)]
+        while stack:
+            dest, source = stack.pop()
+            for k, v in source.items():
+                if isinstance(v, dict):
+                    if k not in dest:
+                        dest[k] = OrderedDict()
+                    stack.append((dest[k], v))
+                else:
+                    dest[k] = v
         return d
 
     @pyaedt_function_handler()
@@ -232,23 +245,15 @@ class NativeComponentObject(BoundaryCommon, object):
         """
 
         self.name = "EditNativeComponentDefinitionData"
-        self.update_props = OrderedDict({})
-        self.update_props["DefinitionName"] = self.props["SubmodelDefinitionName"]
-        self.update_props["GeometryDefinitionParameters"] = self.props["GeometryDefinitionParameters"]
-        self.update_props["DesignDefinitionParameters"] = self.props["DesignDefinitionParameters"]
-        self.update_props["MaterialDefinitionParameters"] = self.props["MaterialDefinitionParameters"]
-        self.update_props["NextUniqueID"] = self.props["NextUniqueID"]
-        self.update_props["MoveBackwards"] = self.props["MoveBackwards"]
-        self.update_props["DatasetType"] = self.props["DatasetType"]
-        self.update_props["DatasetDefinitions"] = self.props["DatasetDefinitions"]
-        self.update_props["NativeComponentDefinitionProvider"] = self.props["NativeComponentDefinitionProvider"]
-        self.update_props["ComponentName"] = self.props["BasicComponentInfo"]["ComponentName"]
-        self.update_props["Company"] = self.props["BasicComponentInfo"]["Company"]
-        self.update_props["Model Number"] = self.props["BasicComponentInfo"]["Model Number"]
-        self.update_props["Help URL"] = self.props["BasicComponentInfo"]["Help URL"]
-        self.update_props["Version"] = self.props["BasicComponentInfo"]["Version"]
-        self.update_props["Notes"] = self.props["BasicComponentInfo"]["Notes"]
-        self.update_props["IconType"] = self.props["BasicComponentInfo"]["IconType"]
+        props = self.props
+        component_info = props["BasicComponentInfo"]
+        update_props = OrderedDict()
+        update_props["DefinitionName"] = props["SubmodelDefinitionName"]
+        for key in self._definition_keys:
+            update_props[key] = props[key]
+        for key in self._component_info_keys:
+            update_props[key] = component_info[key]
+        self.update_props = update_props
         self._app.modeler.oeditor.EditNativeComponentDefinition(self._get_args(self.update_props))
 
         return True
@@ -287,6 +292,78 @@ class BoundaryObject(BoundaryCommon, object):
     >>> coat = hfss.assign_coating([inner_id], "copper", usethickness=True, thickness="0.2mm")
     """
 
+    # Scripting methods assigning and editing each boundary type.
+    # ``None`` means that the boundary type cannot be edited.
+    _boundary_methods = {
+        "Perfect E": ("AssignPerfectE", "EditPerfectE"),
+        "Perfect H": ("AssignPerfectH", "EditPerfectH"),
+        "Aperture": ("AssignAperture", "EditAperture"),
+        "Radiation": ("AssignRadiation", "EditRadiation"),
+        "Finite Conductivity": ("AssignFiniteCond", "EditFiniteCond"),
+        "Lumped RLC": ("AssignLumpedRLC", "EditLumpedRLC"),
+        "Impedance": ("AssignImpedance", "EditImpedance"),
+        "Layered Impedance": ("AssignLayeredImp", "EditLayeredImpedance"),
+        "Anisotropic Impedance": ("AssignAnisotropicImpedance", "EditAssignAnisotropicImpedance"),
+        "Primary": ("AssignPrimary", "EditPrimary"),
+        "Secondary": ("AssignSecondary", "EditSecondary"),
+        "Lattice Pair": ("AssignLatticePair", "EditLatticePair"),
+        "HalfSpace": ("AssignHalfSpace", "EditHalfSpace"),
+        "Multipaction SEE": ("AssignMultipactionSEE", "EditMultipactionSEE"),
+        "Fresnel": ("AssignFresnel", "EditFresnel"),
+        "Symmetry": ("AssignSymmetry", "EditSymmetry"),
+        "Zero Tangential H Field": ("AssignZeroTangentialHField", "EditZeroTangentialHField"),
+        "Zero Integrated Tangential H Field": (
+            "AssignIntegratedZeroTangentialHField",
+            "EditIntegratedZeroTangentialHField",
+        ),
+        "Tangential H Field": ("AssignTangentialHField", "EditTangentialHField"),
+        "Insulating": ("AssignInsulating", "EditInsulating"),
+        "Independent": ("AssignIndependent", "EditIndependent"),
+        "Dependent": ("AssignDependent", "EditDependent"),
+        "InfiniteGround": ("AssignInfiniteGround", "EditInfiniteGround"),
+        "ThinConductor": ("AssignThinConductor", "EditThinConductor"),
+        "Stationary Wall": ("AssignStationaryWallBoundary", "EditStationaryWallBoundary"),
+        "Symmetry Wall": ("AssignSymmetryWallBoundary", "EditSymmetryWallBoundary"),
+        "Resistance": ("AssignResistanceBoundary", "EditResistanceBoundary"),
+        "Conducting Plate": ("AssignConductingPlateBoundary", "EditConductingPlateBoundary"),
+        "Adiabatic Plate": ("AssignAdiabaticPlateBoundary", "EditAdiabaticPlateBoundary"),
+        "Network": ("AssignNetworkBoundary", "EditNetworkBoundary"),
+        "Grille": ("AssignGrilleBoundary", "EditGrilleBoundary"),
+        "Block": ("AssignBlockBoundary", "EditBlockBoundary"),
+        "SourceIcepak": ("AssignSourceBoundary", None),
+        "Opening": ("AssignOpeningBoundary", "EditOpeningBoundary"),
+        "EMLoss": ("AssignEMLoss", "EditEMLoss"),
+        "ThermalCondition": ("AssignThermalCondition", None),
+        "Convection": ("AssignConvection", None),
+        "Temperature": ("AssignTemperature", None),
+        "RotatingFluid": ("AssignRotatingFluid", None),
+        "Frictionless": ("AssignFrictionlessSupport", None),
+        "FixedSupport": ("AssignFixedSupport", None),
+        "Voltage": ("AssignVoltage", "EditVoltage"),
+        "VoltageDrop": ("AssignVoltageDrop", "EditVoltageDrop"),
+        "Current": ("AssignCurrent", "EditCurrent"),
+        "Balloon": ("AssignBalloon", None),
+        "Winding": ("AssignWindingGroup", "EditWindingGroup"),
+        "Winding Group": ("AssignWindingGroup", "EditWindingGroup"),
+        "Vector Potential": ("AssignVectorPotential", "EditVectorPotential"),
+        "CoilTerminal": ("AssignCoilTerminal", "EditCoilTerminal"),
+        "Coil Terminal": ("AssignCoilTerminal", "EditCoilTerminal"),
+        "Coil": ("AssignCoil", "EditCoil"),
+        "Source": ("AssignSource", "EditTerminal"),
+        "Sink": ("AssignSink", "EditTerminal"),
+        "SignalNet": ("AssignSignalNet", "EditTerminal"),
+        "GroundNet": ("AssignGroundNet", "EditTerminal"),
+        "FloatingNet": ("AssignFloatingNet", "EditTerminal"),
+        "SignalLine": ("AssignSingleSignalLine", None),
+        "ReferenceGround": ("AssignSingleReferenceGround", None),
+        "Circuit Port": ("AssignCircuitPort", "EditCircuitPort"),
+        "Lumped Port": ("AssignLumpedPort", "EditLumpedPort"),
+        "Wave Port": ("AssignWavePort", "EditWavePort"),
+        "Floquet Port": ("AssignFloquetPort", "EditFloquetPort"),
+        "SBRTxRxSettings": ("SetSBRTxRxSettings", None),
+        "EndConnection": ("AssignEndConnection", "EditEndConnection"),
+    }
+
     def __init__(self, app, name, props, boundarytype):
         self.auto_update = False
         self._app = app
@@ -296,6 +373,57 @@ class BoundaryObject(BoundaryCommon, object):
         self._boundary_name = self.name
         self.auto_update = True
 
+    @classmethod
+    @pyaedt_function_handler()
+    def delete_many(cls, app, boundaries):
+        """Delete several boundaries with a single AEDT call per module.
+
+        Boundaries and Maxwell parameters are deleted in one call each. Other objects,
+        such as native components and field setups, are deleted with their own
+        ``delete()`` method.
+
+        Parameters
+        ----------
+        app : :class:`pyaedt.application.Analysis.Analysis`
+            Application owning the boundaries.
+        boundaries : list
+            List of boundaries to delete.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        """
+        parameters = []
+        others = []
+        for b in boundaries:
+            if not isinstance(b, (BoundaryObject, MaxwellParameters)):
+                if not b.delete():
+                    return False
+            elif b.type in ["Matrix", "Force", "Torque"]:
+                parameters.append(b.name)
+            else:
+                others.append(b.name)
+        if parameters:
+            app.o_maxwell_parameters.DeleteParameters(parameters)
+        if others:
+            app.oboundary.DeleteBoundaries(others)
+        names = set(parameters + others)
+        app.boundaries[:] = [b for b in app.boundaries if b.name not in names]
+        return True
+
+    @property
+    def type(self):
+        """Boundary type."""
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        # Interned so that comparisons with the boundary type names match by identity.
+        self._type = intern(str(value))
+        self._assign_method, self._edit_method = self._boundary_methods.get(self._type, (None, None))
+
     @property
     def name(self):
         """Boundary Name."""
@@ -337,129 +465,7 @@ class BoundaryObject(BoundaryCommon, object):
             ``True`` when successful, ``False`` when failed.
 
         """
-        if self.type == "Perfect E":
-            self._app.oboundary.AssignPerfectE(self._get_args())
-        elif self.type == "Perfect H":
-            self._app.oboundary.AssignPerfectH(self._get_args())
-        elif self.type == "Aperture":
-            self._app.oboundary.AssignAperture(self._get_args())
-        elif self.type == "Radiation":
-            self._app.oboundary.AssignRadiation(self._get_args())
-        elif self.type == "Finite Conductivity":
-            self._app.oboundary.AssignFiniteCond(self._get_args())
-        elif self.type == "Lumped RLC":
-            self._app.oboundary.AssignLumpedRLC(self._get_args())
-        elif self.type == "Impedance":
-            self._app.oboundary.AssignImpedance(self._get_args())
-        elif self.type == "Layered Impedance":
-            self._app.oboundary.AssignLayeredImp(self._get_args())
-        elif self.type == "Anisotropic Impedance":
-            self._app.oboundary.AssignAnisotropicImpedance(self._get_args())
-        elif self.type == "Primary":
-            self._app.oboundary.AssignPrimary(self._get_args())
-        elif self.type == "Secondary":
-            self._app.oboundary.AssignSecondary(self._get_args())
-        elif self.type == "Lattice Pair":
-            self._app.oboundary.AssignLatticePair(self._get_args())
-        elif self.type == "HalfSpace":
-            self._app.oboundary.AssignHalfSpace(self._get_args())
-        elif self.type == "Multipaction SEE":
-            self._app.oboundary.AssignMultipactionSEE(self._get_args())
-        elif self.type == "Fresnel":
-            self._app.oboundary.AssignFresnel(self._get_args())
-        elif self.type == "Symmetry":
-            self._app.oboundary.AssignSymmetry(self._get_args())
-        elif self.type == "Zero Tangential H Field":
-            self._app.oboundary.AssignZeroTangentialHField(self._get_args())
-        elif self.type == "Zero Integrated Tangential H Field":
-            self._app.oboundary.AssignIntegratedZeroTangentialHField(self._get_args())
-        elif self.type == "Tangential H Field":
-            self._app.oboundary.AssignTangentialHField(self._get_args())
-        elif self.type == "Insulating":
-            self._app.oboundary.AssignInsulating(self._get_args())
-        elif self.type == "Independent":
-            self._app.oboundary.AssignIndependent(self._get_args())
-        elif self.type == "Dependent":
-            self._app.oboundary.AssignDependent(self._get_args())
-        elif self.type == "Band":
-            self._app.omodelsetup.AssignBand(self._get_args())
-        elif self.type == "InfiniteGround":
-            self._app.oboundary.AssignInfiniteGround(self._get_args())
-        elif self.type == "ThinConductor":
-            self._app.oboundary.AssignThinConductor(self._get_args())
-        elif self.type == "Stationary Wall":
-            self._app.oboundary.AssignStationaryWallBoundary(self._get_args())
-        elif self.type == "Symmetry Wall":
-            self._app.oboundary.AssignSymmetryWallBoundary(self._get_args())
-        elif self.type == "Resistance":
-            self._app.oboundary.AssignResistanceBoundary(self._get_args())
-        elif self.type == "Conducting Plate":
-            self._app.oboundary.AssignConductingPlateBoundary(self._get_args())
-        elif self.type == "Adiabatic Plate":
-            self._app.oboundary.AssignAdiabaticPlateBoundary(self._get_args())
-        elif self.type == "Network":
-            self._app.oboundary.AssignNetworkBoundary(self._get_args())
-        elif self.type == "Grille":
-            self._app.oboundary.AssignGrilleBoundary(self._get_args())
-        elif self.type == "Block":
-            self._app.oboundary.AssignBlockBoundary(self._get_args())
-        elif self.type == "SourceIcepak":
-            self._app.oboundary.AssignSourceBoundary(self._get_args())
-        elif self.type == "Opening":
-            self._app.oboundary.AssignOpeningBoundary(self._get_args())
-        elif self.type == "EMLoss":
-            self._app.oboundary.AssignEMLoss(self._get_args())
-        elif self.type == "ThermalCondition":
-            self._app.oboundary.AssignThermalCondition(self._get_args())
-        elif self.type == "Convection":
-            self._app.oboundary.AssignConvection(self._get_args())
-        elif self.type == "Temperature":
-            self._app.oboundary.AssignTemperature(self._get_args())
-        elif self.type == "RotatingFluid":
-            self._app.oboundary.AssignRotatingFluid(self._get_args())
-        elif self.type == "Frictionless":
-            self._app.oboundary.AssignFrictionlessSupport(self._get_args())
-        elif self.type == "FixedSupport":
-            self._app.oboundary.AssignFixedSupport(self._get_args())
-        elif self.type == "Voltage":
-            self._app.oboundary.AssignVoltage(self._get_args())
-        elif self.type == "VoltageDrop":
-            self._app.oboundary.AssignVoltageDrop(self._get_args())
-        elif self.type == "Current":
-            self._app.oboundary.AssignCurrent(self._get_args())
-        elif self.type == "Balloon":
-            self._app.oboundary.AssignBalloon(self._get_args())
-        elif self.type == "Winding" or self.type == "Winding Group":
-            self._app.oboundary.AssignWindingGroup(self._get_args())
-        elif self.type == "Vector Potential":
-            self._app.oboundary.AssignVectorPotential(self._get_args())
-        elif self.type == "CoilTerminal" or self.type == "Coil Terminal":
-            self._app.oboundary.AssignCoilTerminal(self._get_args())
-        elif self.type == "Coil":
-            self._app.oboundary.AssignCoil(self._get_args())
-        elif self.type == "Source":
-            self._app.oboundary.AssignSource(self._get_args())
-        elif self.type == "Sink":
-            self._app.oboundary.AssignSink(self._get_args())
-        elif self.type == "SignalNet":
-            self._app.oboundary.AssignSignalNet(self._get_args())
-        elif self.type == "GroundNet":
-            self._app.oboundary.AssignGroundNet(self._get_args())
-        elif self.type == "FloatingNet":
-            self._app.oboundary.AssignFloatingNet(self._get_args())
-        elif self.type == "SignalLine":
-            self._app.oboundary.AssignSingleSignalLine(self._get_args())
-        elif self.type == "ReferenceGround":
-            self._app.oboundary.AssignSingleReferenceGround(self._get_args())
-        elif self.type == "Circuit Port":
-            self._app.oboundary.AssignCircuitPort(self._get_args())
-        elif self.type == "Lumped Port":
-            self._app.oboundary.AssignLumpedPort(self._get_args())
-        elif self.type == "Wave Port":
-            self._app.oboundary.AssignWavePort(self._get_args())
-        elif self.type == "Floquet Port":
-            self._app.oboundary.AssignFloquetPort(self._get_args())
-        elif self.type == "AutoIdentify":
+        if self.type == "AutoIdentify":
             self._app.oboundary.AutoIdentifyPorts(
                 ["NAME:Faces", self.props["Faces"]],
                 self.props["IsWavePort"],
@@ -467,10 +473,10 @@ class BoundaryObject(BoundaryCommon, object):
                 self.name,
                 self.props["RenormalizeModes"],
             )
-        elif self.type == "SBRTxRxSettings":
-            self._app.oboundary.SetSBRTxRxSettings(self._get_args())
-        elif self.type == "EndConnection":
-            self._app.oboundary.AssignEndConnection(self._get_args())
+        elif self.type == "Band":
+            self._app.omodelsetup.AssignBand(self._get_args())
+        elif self._assign_method:
+            getattr(self._app.oboundary, self._assign_method)(self._get_args())
         else:
             return False
         return True
@@ -485,114 +491,14 @@ class BoundaryObject(BoundaryCommon, object):
             ``True`` when successful, ``False`` when failed.
 
         """
-        if self.type == "Perfect E":
-            self._app.oboundary.EditPerfectE(self._boundary_name, self._get_args())
-        elif self.type == "Perfect H":
-            self._app.oboundary.EditPerfectH(self._boundary_name, self._get_args())
-        elif self.type == "Aperture":
-            self._app.oboundary.EditAperture(self._boundary_name, self._get_args())
-        elif self.type == "Radiation":
-            self._app.oboundary.EditRadiation(self._boundary_name, self._get_args())
-        elif self.type == "Finite Conductivity":
-            self._app.oboundary.EditFiniteCond(self._boundary_name, self._get_args())
-        elif self.type == "Lumped RLC":
-            self._app.oboundary.EditLumpedRLC(self._boundary_name, self._get_args())
-        elif self.type == "Impedance":
-            self._app.oboundary.EditImpedance(self._boundary_name, self._get_args())
-        elif self.type == "Layered Impedance":
-            self._app.oboundary.EditLayeredImpedance(self._boundary_name, self._get_args())
-        elif self.type == "Anisotropic Impedance":
-            self._app.oboundary.EditAssignAnisotropicImpedance(
-                self._boundary_name, self._get_args()
-            )  # pragma: no cover
-        elif self.type == "Primary":
-            self._app.oboundary.EditPrimary(self._boundary_name, self._get_args())
-        elif self.type == "Secondary":
-            self._app.oboundary.EditSecondary(self._boundary_name, self._get_args())
-        elif self.type == "Lattice Pair":
-            self._app.oboundary.EditLatticePair(self._boundary_name, self._get_args())
-        elif self.type == "HalfSpace":
-            self._app.oboundary.EditHalfSpace(self._boundary_name, self._get_args())
-        elif self.type == "Multipaction SEE":
-            self._app.oboundary.EditMultipactionSEE(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Fresnel":
-            self._app.oboundary.EditFresnel(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Symmetry":
-            self._app.oboundary.EditSymmetry(self._boundary_name, self._get_args())
-        elif self.type == "Zero Tangential H Field":
-            self._app.oboundary.EditZeroTangentialHField(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Zero Integrated Tangential H Field":
-            self._app.oboundary.EditIntegratedZeroTangentialHField(
-                self._boundary_name, self._get_args()
-            )  # pragma: no cover
-        elif self.type == "Tangential H Field":
-            self._app.oboundary.EditTangentialHField(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Insulating":
-            self._app.oboundary.EditInsulating(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Independent":
-            self._app.oboundary.EditIndependent(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Dependent":
-            self._app.oboundary.EditDependent(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Band":
+        if self.type == "Band":
             self._app.omodelsetup.EditMotionSetup(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "InfiniteGround":
-            self._app.oboundary.EditInfiniteGround(self._boundary_name, self._get_args())
-        elif self.type == "ThinConductor":
-            self._app.oboundary.EditThinConductor(self._boundary_name, self._get_args())
-        elif self.type == "Stationary Wall":
-            self._app.oboundary.EditStationaryWallBoundary(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Symmetry Wall":
-            self._app.oboundary.EditSymmetryWallBoundary(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Resistance":
-            self._app.oboundary.EditResistanceBoundary(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Conducting Plate":
-            self._app.oboundary.EditConductingPlateBoundary(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Adiabatic Plate":
-            self._app.oboundary.EditAdiabaticPlateBoundary(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Network":
-            self._app.oboundary.EditNetworkBoundary(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Grille":
-            self._app.oboundary.EditGrilleBoundary(self._boundary_name, self._get_args())
-        elif self.type == "Opening":
-            self._app.oboundary.EditOpeningBoundary(self._boundary_name, self._get_args())
-        elif self.type == "EMLoss":
-            self._app.oboundary.EditEMLoss(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Block":
-            self._app.oboundary.EditBlockBoundary(self._boundary_name, self._get_args())
         elif self.type == "SourceIcepak":
             self._app.oboundary.EditSourceBoundary(self._get_args())
-        elif self.type == "Voltage":
-            self._app.oboundary.EditVoltage(self._boundary_name, self._get_args())
-        elif self.type == "VoltageDrop":
-            self._app.oboundary.EditVoltageDrop(self._boundary_name, self._get_args())
-        elif self.type == "Current":
-            self._app.oboundary.EditCurrent(self._boundary_name, self._get_args())
-        elif self.type == "Winding" or self.type == "Winding Group":
-            self._app.oboundary.EditWindingGroup(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Vector Potential":
-            self._app.oboundary.EditVectorPotential(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "CoilTerminal" or self.type == "Coil Terminal":
-            self._app.oboundary.EditCoilTerminal(self._boundary_name, self._get_args())
-        elif self.type == "Coil":
-            self._app.oboundary.EditCoil(self._boundary_name, self._get_args())
-        elif self.type == "Source":
-            self._app.oboundary.EditTerminal(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "Sink":
-            self._app.oboundary.EditTerminal(self._boundary_name, self._get_args())
-        elif self.type == "SignalNet" or self.type == "GroundNet" or self.type == "FloatingNet":
-            self._app.oboundary.EditTerminal(self._boundary_name, self._get_args())
-        elif self.type in "Circuit Port":
-            self._app.oboundary.EditCircuitPort(self._boundary_name, self._get_args())
-        elif self.type in "Lumped Port":
-            self._app.oboundary.EditLumpedPort(self._boundary_name, self._get_args())
-        elif self.type in "Wave Port":
-            self._app.oboundary.EditWavePort(self._boundary_name, self._get_args())
-        elif self.type == "SetSBRTxRxSettings":
+        elif self.type == "SBRTxRxSettings":
             self._app.oboundary.SetSBRTxRxSettings(self._get_args())  # pragma: no cover
-        elif self.type == "Floquet Port":
-            self._app.oboundary.EditFloquetPort(self._boundary_name, self._get_args())  # pragma: no cover
-        elif self.type == "End Connection":
-            self._app.oboundary.EditEndConnection(self._boundary_name, self._get_args())
+        elif self._edit_method:
+            getattr(self._app.oboundary, self._edit_method)(self._boundary_name, self._get_args())
         else:
             return False  # pragma: no cover
         self._boundary_name = self.name
@@ -610,14 +516,9 @@ class BoundaryObject(BoundaryCommon, object):
         """
         if "Faces" in self.props:
             faces = self.props["Faces"]
-            faces_out = []
-            if type(faces) is not list:
+            if not isinstance(faces, (list, tuple)):
                 faces = [faces]
-            for f in faces:
-                if type(f) is EdgePrimitive or type(f) is FacePrimitive or type(f) is VertexPrimitive:
-                    faces_out.append(f.id)
-                else:
-                    faces_out.append(f)
+            faces_out = [f.id if isinstance(f, _PRIMITIVE_TYPES) else f for f in faces]
             self._app.oboundary.ReassignBoundary(["Name:" + self.name, "Faces:=", faces_out])
         elif "Objects" in self.props:
 
@@ -14,6 +14,110 @@ from pyaedt.modules.OptimetricsTemplates import defaultsensitivitySetup
 from pyaedt.modules.OptimetricsTemplates import defaultstatisticalSetup
 from pyaedt.modules.SetupTemplates import SetupProps
 
+try:
+    from types import MappingProxyType
+except ImportError:  # pragma: no cover
+    MappingProxyType = None
+
+
+def _freeze(obj):
+    """Build a read-only copy of a default optimetrics template.
+
+    Dictionaries are wrapped in ``MappingProxyType`` when it is available and lists are
+    turned into tuples, so that templates can be shared between setups without aliasing.
+
+    Parameters
+    ----------
+    obj : object
+        Template or template value to freeze.
+
+    Returns
+    -------
+    object
+        Read-only copy of the object.
+    """
+    if isinstance(obj, dict):
+        frozen = {k: _freeze(v) for k, v in obj.items()}
+        return MappingProxyType(frozen) if MappingProxyType else frozen
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+_default_setups = {
+    "OptiParametric": _freeze(defaultparametricSetup),
+    "OptiDesignExplorer": _freeze(defaultdxSetup),
+    "OptiOptimization": _freeze(defaultoptiSetup),
+    "OptiSensitivity": _freeze(defaultsensitivitySetup),
+    "OptiStatistical": _freeze(defaultstatisticalSetup),
+    "OptiDXDOE": _freeze(defaultdoeSetup),
+}
+_default_setups["optiSLang"] = _default_setups["OptiDesignExplorer"]
+
+
+def _clone(obj):
+    """Deep copy a tree of AEDT properties or a frozen default template.
+
+    Properties only contain dictionaries, lists and immutable scalars, so they are copied
+    with a type dispatch instead of the generic ``copy.deepcopy`` machinery. Read-only
+    dictionaries and tuples built by ``_freeze`` are copied to dictionaries and lists.
+
+    Parameters
+    ----------
+    obj : object
+        Object to copy.
+
+    Returns
+    -------
+    object
+        Mutable copy of the object.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return [_clone(v) for v in obj]
+    if isinstance(obj, OrderedDict):
+        return OrderedDict((k, _clone(v)) for k, v in obj.items())
+    if isinstance(obj, dict) or (MappingProxyType and isinstance(obj, MappingProxyType)):
+        return {k: _clone(v) for k, v in obj.items()}
+    return copy.deepcopy(obj)
+
+
+def _sweep_definition(variable, data):
+    """Build the sweep definition of a variable.
+
+    Parameters
+    ----------
+    variable : str
+        Name of the variable.
+    data : str
+        Sweep range of the variable.
+
+    Returns
+    -------
+    :class:`collections.OrderedDict`
+        Sweep definition.
+    """
+    return OrderedDict([("Variable", variable), ("Data", data), ("OffsetF1", False), ("Synchronize", 0)])
+
+
+def _goal_value(value):
+    """Build the value of an optimetrics goal.
+
+    Parameters
+    ----------
+    value : float or str
+        Goal value.
+
+    Returns
+    -------
+    :class:`collections.OrderedDict`
+        Goal value definition.
+    """
+    return OrderedDict(
+        [("GoalValueType", "Independent"), ("Format", "Real/Imag"), ("bG", ["v:=", "[{};]".format(value)])]
+    )
+
 
 class CommonOptimetrics(PropsManager, object):
     """Creates and sets up optimizations.
@@ -31,29 +135,19 @@ class CommonOptimetrics(PropsManager, object):
 
     """
 
+    __slots__ = ("auto_update", "_app", "omodule", "name", "soltype", "props", "_last_arg")
+
     def __init__(self, p_app, name, dictinputs, optimtype):
         self.auto_update = False
         self._app = p_app
         self.omodule = self._app.ooptimetrics
         self.name = name
         self.soltype = optimtype
+        self._last_arg = None
 
-        inputd = copy.deepcopy(dictinputs)
-
-        if optimtype == "OptiParametric":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultparametricSetup))
-        if optimtype == "OptiDesignExplorer":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultdxSetup))
-        if optimtype == "OptiOptimization":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultoptiSetup))
-        if optimtype == "OptiSensitivity":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultsensitivitySetup))
-        if optimtype == "OptiStatistical":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultstatisticalSetup))
-        if optimtype == "OptiDXDOE":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultdoeSetup))
-        if optimtype == "optiSLang":
-            self.props = SetupProps(self, inputd or copy.deepcopy(defaultdxSetup))
+        inputd = _clone(dictinputs) if dictinputs else None
+
+        self.props = SetupProps(self, inputd or _clone(_default_setups[optimtype]))
         if inputd:
             self.props.pop("ID", None)
             self.props.pop("NextUniqueID", None)
@@ -63,18 +157,11 @@ class CommonOptimetrics(PropsManager, object):
             self.props.pop("SetupType", None)
             if inputd.get("Sim. Setups"):
                 setups = inputd["Sim. Setups"]
-                for el in setups:
-                    if type(self._app.design_properties["SolutionManager"]["ID Map"]["Setup"]) is list:
-                        for setup in self._app.design_properties["SolutionManager"]["ID Map"]["Setup"]:
-                            if setup["I"] == el:
-                                setups[setups.index(el)] = setup["I"]
-                                break
-                    else:
-                        if self._app.design_properties["SolutionManager"]["ID Map"]["Setup"]["I"] == el:
-                            setups[setups.index(el)] = self._app.design_properties["SolutionManager"]["ID Map"][
-                                "Setup"
-                            ]["N"]
-                            break
+                setup_map = self._app.design_properties["SolutionManager"]["ID Map"]["Setup"]
+                if not isinstance(setup_map, list):
+                    setup_map = [setup_map]
+                setup_names = {setup["I"]: setup["N"] for setup in setup_map}
+                setups[:] = [setup_names.get(el, el) for el in setups]
             if inputd.get("Goals", None):
                 if self._app._is_object_oriented_enabled():
                     oparams = self.omodule.GetChildObject(self.name).GetCalculationInfo()
@@ -86,6 +173,25 @@ class CommonOptimetrics(PropsManager, object):
                     self.props["Goals"] = arg1
         self.auto_update = True
 
+    @pyaedt_function_handler()
+    def delete(self):
+        """Delete a defined Optimetrics Setup.
+
+        Returns
+        -------
+        bool
+            `True` if setup is deleted. `False` if it failed.
+
+        References
+        ----------
+
+        >>> oModule.DeleteSetups
+        """
+
+        self.omodule.DeleteSetups([self.name])
+        getattr(self._app, self._container_name).setups.remove(self)
+        return True
+
     @pyaedt_function_handler()
     def _get_context(
         self,
@@ -102,20 +208,14 @@ class CommonOptimetrics(PropsManager, object):
         polyline_points=0,
         is_goal=False,
     ):
-        did = 3
-        if domain != "Sweep":
-            did = 1
-        sweepdefinition = OrderedDict()
-        sweepdefinition["ReportType"] = report_category
+        did = 3 if domain == "Sweep" else 1
         if not setup_sweep_name:
             setup_sweep_name = self._app.nominal_sweep
-        sweepdefinition["Solution"] = setup_sweep_name
-        ctxt = OrderedDict({})
+        ctxt = OrderedDict()
 
         if self._app.solution_type in ["TR", "AC", "DC"]:
             ctxt["SimValueContext"] = [did, 0, 2, 0, False, False, -1, 1, 0, 1, 1, "", 0, 0]
             setup_sweep_name = self._app.solution_type
-            sweepdefinition["Solution"] = setup_sweep_name
 
         elif self._app.solution_type in ["HFSS3DLayout"]:
             if context == "Differential Pairs":
@@ -165,10 +265,16 @@ class CommonOptimetrics(PropsManager, object):
                 ctxt["PointCount"] = polyline_points
         else:
             ctxt = OrderedDict({"Domain": domain})
-        sweepdefinition["SimValueContext"] = ctxt
-        sweepdefinition["Calculation"] = expressions
-        sweepdefinition["Name"] = expressions
-        sweepdefinition["Ranges"] = OrderedDict({})
+        sweepdefinition = OrderedDict(
+            [
+                ("ReportType", report_category),
+                ("Solution", setup_sweep_name),
+                ("SimValueContext", ctxt),
+                ("Calculation", expressions),
+                ("Name", expressions),
+                ("Ranges", OrderedDict()),
+            ]
+        )
         if context and context in self._app.modeler.line_names and intrinsics and "Distance" not in intrinsics:
             sweepdefinition["Ranges"]["Range"] = ("Var:=", "Distance", "Type:=", "a")
         if not setup_sweep_name:
@@ -180,37 +286,25 @@ class CommonOptimetrics(PropsManager, object):
             self._app.logger.error("Sweep not Available.")
             return False
         if intrinsics:
+            ranges = sweepdefinition["Ranges"]
             for v, k in intrinsics.items():
                 if not k:
-                    r = ["Var:=", v, "Type:=", "a"]
+                    r = ("Var:=", v, "Type:=", "a")
                 elif isinstance(k, tuple):
-                    r = ["Var:=", v, "Type:=", "rd"]
-                    r.append("Start:=")
-                    r.append(k[0])
-                    r.append("Stop:=")
-                    r.append(k[1])
-                    r.append("DiscreteValues:=")
-                    r.append("")
+                    r = ("Var:=", v, "Type:=", "rd", "Start:=", k[0], "Stop:=", k[1], "DiscreteValues:=", "")
                 elif isinstance(k, (list, str)):
-                    r = ["Var:=", v, "Type:=", "d"]
-                    r.append("DiscreteValues:=")
-                    if isinstance(k, list):
-                        r.append(",".join(k))
-                    else:
-                        r.append(k)
-
-                if not sweepdefinition["Ranges"]:
-                    sweepdefinition["Ranges"]["Range"] = tuple(r)
-                elif isinstance(sweepdefinition["Ranges"]["Range"], list):
-                    sweepdefinition["Ranges"]["Range"].append(tuple(r))
+                    r = ("Var:=", v, "Type:=", "d", "DiscreteValues:=", ",".join(k) if isinstance(k, list) else k)
+
+                existing = ranges.get("Range")
+                if existing is None:
+                    ranges["Range"] = r
+                elif isinstance(existing, list):
+                    existing.append(r)
                 else:
-                    sweepdefinition["Ranges"]["Range"] = [sweepdefinition["Ranges"]["Range"]]
-                    sweepdefinition["Ranges"]["Range"].append(tuple(r))
+                    ranges["Range"] = [existing, r]
         if is_goal:
             sweepdefinition["Condition"] = condition
-            sweepdefinition["GoalValue"] = OrderedDict(
-                {"GoalValueType": "Independent", "Format": "Real/Imag", "bG": ["v:=", "[{};]".format(goal_value)]}
-            )
+            sweepdefinition["GoalValue"] = _goal_value(goal_value)
             sweepdefinition["Weight"] = "[{};]".format(goal_weight)
         return sweepdefinition
 
@@ -218,6 +312,11 @@ class CommonOptimetrics(PropsManager, object):
     def update(self, update_dictionary=None):
         """Update the setup based on stored properties.
 
+        ``EditSetup`` is called only when the setup arguments differ from the last ones that
+        this object sent to AEDT with ``create()`` or ``update()``. Changes made to the setup
+        directly in AEDT are not tracked, so they are not overwritten by an update that leaves
+        the stored properties unchanged. The method still returns ``True`` in this case.
+
         Parameters
         ----------
         update_dictionary : dict, optional
@@ -239,10 +338,35 @@ class CommonOptimetrics(PropsManager, object):
 
         arg = ["NAME:" + self.name]
         _dict2arg(self.props, arg)
+        # The arguments reference lists held by props, so compare a snapshot.
+        last_arg = repr(arg)
+        if last_arg == self._last_arg:
+            return True
 
         self.omodule.EditSetup(self.name, arg)
+        self._last_arg = last_arg
         return True
 
+    @pyaedt_function_handler()
+    def flush(self):
+        """Push the stored properties to AEDT once.
+
+        Use this method after adding calculations or goals with ``defer_update=True``.
+        As with :func:`update`, nothing is sent to AEDT if the stored properties did not
+        change since the last push.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+
+        >>> oModule.EditSetup
+        """
+        return self.update()
+
     @pyaedt_function_handler()
     def create(self):
         """Create a setup.
@@ -260,6 +384,7 @@ class CommonOptimetrics(PropsManager, object):
         arg = ["NAME:" + self.name]
         _dict2arg(self.props, arg)
         self.omodule.InsertSetup(self.soltype, arg)
+        self._last_arg = repr(arg)
         return True
 
     @pyaedt_function_handler()
@@ -277,6 +402,7 @@ class CommonOptimetrics(PropsManager, object):
         condition="<=",
         goal_value=1,
         goal_weight=1,
+        defer_update=False,
     ):
         self.auto_update = False
         if not solution:
@@ -300,12 +426,9 @@ class CommonOptimetrics(PropsManager, object):
             elif self._app.solution_type in ["Q3D Extractor", "2D Extractor"]:
                 report_type = "Matrix"
             elif context:
-                try:
-                    for f in self._app.field_setups:
-                        if context == f.name:
-                            report_type = "Far Fields"
-                except:
-                    pass
+                for f in getattr(self._app, "field_setups", None) or []:
+                    if context == f.name:
+                        report_type = "Far Fields"
         sweepdefinition = self._get_context(
             calculation,
             condition,
@@ -325,7 +448,7 @@ class CommonOptimetrics(PropsManager, object):
             for el in list(variables):
                 try:
                     dx_variables[el] = self._app[el]
-                except:
+                except KeyError:
                     pass
         for v in list(dx_variables.keys()):
             self._activate_variable(v)
@@ -333,15 +456,17 @@ class CommonOptimetrics(PropsManager, object):
             optigoalname = "CostFunctionGoals"
         else:
             optigoalname = "Goals"
-        if "Goal" in self.props[optigoalname]:
-            if type(self.props[optigoalname]["Goal"]) is not list:
-                self.props[optigoalname]["Goal"] = [self.props[optigoalname]["Goal"], sweepdefinition]
-            else:
-                self.props[optigoalname]["Goal"].append(sweepdefinition)
+        goals = self.props[optigoalname]
+        existing = goals.get("Goal")
+        if existing is None:
+            goals["Goal"] = sweepdefinition
+        elif isinstance(existing, list):
+            existing.append(sweepdefinition)
         else:
-            self.props[optigoalname] = OrderedDict({})
-            self.props[optigoalname]["Goal"] = sweepdefinition
+            goals["Goal"] = [existing, sweepdefinition]
         self.auto_update = True
+        if defer_update:
+            return True
         return self.update()
 
     @pyaedt_function_handler()
@@ -359,6 +484,7 @@ class CommonOptimetrics(PropsManager, object):
         goal_value=1,
         goal_weight=1,
         goal_name=None,
+        defer_update=False,
     ):
         """Add an optimization goal to the setup.
 
@@ -388,78 +514,67 @@ class CommonOptimetrics(PropsManager, object):
             Weight for the optimzation goal. The default is ``1``.
         goal_name : str, optional
             Name of the goal. The default is ``None``.
+        defer_update : bool, optional
+            Whether to skip the update of the setup in AEDT. The default is ``False``.
+            When ``True``, call the ``flush()`` method once after adding all goals.
 
         Returns
         -------
-
+        bool
+            ``True`` when successful, ``False`` when failed.
         """
         self.auto_update = False
-        sweepdefinition = OrderedDict()
-        sweepdefinition["ReportType"] = reporttype
         if not solution:
             solution = self._app.nominal_sweep
         setupname = solution.split(" ")[0]
         if setupname not in self.props["Sim. Setups"]:
             self.props["Sim. Setups"].append(setupname)
-        sweepdefinition["Solution"] = solution
-        sweepdefinition["SimValueContext"] = OrderedDict({"Domain": domain})
-        sweepdefinition["Calculation"] = calculation
-        if goal_name:
-            sweepdefinition["Name"] = goal_name
-        else:
-            sweepdefinition["Name"] = generate_unique_name(calculation)
-        if domain == "Sweep":
-            var = "Freq"
-        else:
-            var = "Time"
+        var = "Freq" if domain == "Sweep" else "Time"
         if calculation_type == "discrete":
             if type(calc_val1) is list:
                 dr = ",".join(calc_val1)
             else:
                 dr = calc_val1
-            sweepdefinition["Ranges"] = OrderedDict({"Range": ["Var:=", var, "Type:=", "d", "DiscreteValues:=", dr]})
+            goal_range = ["Var:=", var, "Type:=", "d", "DiscreteValues:=", dr]
         elif calculation_type == "all":
-            sweepdefinition["Ranges"] = OrderedDict(
-                {
-                    "Range": [
-                        "Var:=",
-                        var,
-                        "Type:=",
-                        "a",
-                    ]
-                }
-            )
+            goal_range = ["Var:=", var, "Type:=", "a"]
         else:
-            sweepdefinition["Ranges"] = OrderedDict(
-                {
-                    "Range": [
-                        "Var:=",
-                        var,
-                        "Type:=",
-                        calculation_type,
-                        "Start:=",
-                        calc_val1,
-                        "Stop:=",
-                        calc_val2,
-                        "DiscreteValues:=",
-                        "",
-                    ]
-                }
-            )
-        sweepdefinition["Condition"] = condition
-        sweepdefinition["GoalValue"] = OrderedDict(
-            {"GoalValueType": "Independent", "Format": "Real/Imag", "bG": ["v:=", "[{};]".format(goal_value)]}
+            goal_range = [
+                "Var:=",
+                var,
+                "Type:=",
+                calculation_type,
+                "Start:=",
+                calc_val1,
+                "Stop:=",
+                calc_val2,
+                "DiscreteValues:=",
+                "",
+            ]
+        sweepdefinition = OrderedDict(
+            [
+                ("ReportType", reporttype),
+                ("Solution", solution),
+                ("SimValueContext", OrderedDict({"Domain": domain})),
+                ("Calculation", calculation),
+                ("Name", goal_name or generate_unique_name(calculation)),
+                ("Ranges", OrderedDict({"Range": goal_range})),
+                ("Condition", condition),
+                ("GoalValue", _goal_value(goal_value)),
+                ("Weight", "[{};]".format(goal_weight)),
+            ]
         )
-        sweepdefinition["Weight"] = "[{};]".format(goal_weight)
-        if "Goal" in self.props[optigoalname]:
-            if type(self.props[optigoalname]["Goal"]) is not list:
-                self.props[optigoalname]["Goal"] = [self.props[optigoalname]["Goal"], sweepdefinition]
-            else:
-                self.props[optigoalname]["Goal"].append(sweepdefinition)
+        goals = self.props[optigoalname]
+        existing = goals.get("Goal")
+        if existing is None:
+            goals["Goal"] = sweepdefinition
+        elif isinstance(existing, list):
+            existing.append(sweepdefinition)
         else:
-            self.props[optigoalname] = OrderedDict({})
-            self.props[optigoalname]["Goal"] = sweepdefinition
+            goals["Goal"] = [existing, sweepdefinition]
         self.auto_update = True
+        if defer_update:
+            return True
         return self.update()
 
     @pyaedt_function_handler()
@@ -477,28 +592,12 @@ class CommonOptimetrics(PropsManager, object):
 class SetupOpti(CommonOptimetrics, object):
     """Sets up an optimization in Opimetrics."""
 
+    __slots__ = ()
+    _container_name = "optimizations"
+
     def __init__(self, app, name, dictinputs=None, optim_type="OptiDesignExplorer"):
         CommonOptimetrics.__init__(self, app, name, dictinputs=dictinputs, optimtype=optim_type)
 
-    @pyaedt_function_handler()
-    def delete(self):
-        """Delete a defined Optimetrics Setup.
-
-        Parameters
-        ----------
-        setup_name : str
-            Name of optimetrics setup to delete.
-
-        Returns
-        -------
-        bool
-            `True` if setup is deleted. `False` if it failed.
-        """
-
-        self.omodule.DeleteSetups([self.name])
-        self._app.optimizations.setups.remove(self)
-        return True
-
     @pyaedt_function_handler()
     def add_calculation(
         self,
@@ -699,10 +798,10 @@ class SetupOpti(CommonOptimetrics, object):
             use_manufacturable,
         ]
         if not self.props.get("Variables", None):
-            self.props["Variables"] = OrderedDict({})
+            self.props["Variables"] = OrderedDict()
         self.props["Variables"][variable_name] = arg
         if not self.props.get("StartingPoint", None):
-            self.props["StartingPoint"] = OrderedDict({})
+            self.props["StartingPoint"] = OrderedDict()
         if not starting_point:
             starting_point = self._app[variable_name]
 
@@ -717,29 +816,13 @@ class SetupOpti(CommonOptimetrics, object):
 class SetupParam(CommonOptimetrics, object):
     """Sets up a parametric analysis in Optimetrics."""
 
+    __slots__ = ()
+    _container_name = "parametrics"
+
     def __init__(self, p_app, name, dictinputs=None, optim_type="OptiParametric"):
         CommonOptimetrics.__init__(self, p_app, name, dictinputs=dictinputs, optimtype=optim_type)
         pass
 
-    @pyaedt_function_handler()
-    def delete(self):
-        """Delete a defined Optimetrics Setup.
-
-        Parameters
-        ----------
-        setup_name : str
-            Name of optimetrics setup to delete.
-
-        Returns
-        -------
-        bool
-            `True` if setup is deleted. `False` if it failed.
-        """
-
-        self.omodule.DeleteSetups([self.name])
-        self._app.parametrics.setups.remove(self)
-        return True
-
     @pyaedt_function_handler()
     def add_variation(self, sweep_var, start_point, end_point=None, step=100, unit=None, variation_type="LinearCount"):
         """Add a variation to an existing parametric setup.
@@ -788,11 +871,7 @@ class SetupParam(CommonOptimetrics, object):
         if not sweep_range:
             return False
         self._activate_variable(sweep_var)
-        sweepdefinition = OrderedDict()
-        sweepdefinition["Variable"] = sweep_var
-        sweepdefinition["Data"] = sweep_range
-        sweepdefinition["OffsetF1"] = False
-        sweepdefinition["Synchronize"] = 0
+        sweepdefinition = _sweep_definition(sweep_var, sweep_range)
         if self.props["Sweeps"]["SweepDefinition"] is None:
             self.props["Sweeps"]["SweepDefinition"] = sweepdefinition
         elif type(self.props["Sweeps"]["SweepDefinition"]) is not list:
@@ -925,6 +1004,61 @@ class SetupParam(CommonOptimetrics, object):
         return True
 
 
+def _setups_by_type(app):
+    """Group the optimetrics setups stored in a design by setup type.
+
+    The grouping is cached on the application until the stored setups are reloaded, so that
+    the parametric and optimization containers share a single scan.
+
+    Parameters
+    ----------
+    app : :class:`pyaedt.application.Analysis.Analysis`
+        Application holding the design.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping each setup type to a list of ``(position, name, data)`` tuples.
+    """
+    design_properties = app.design_properties or {}
+    optimetrics = design_properties.get("Optimetrics") or {}
+    setups_data = optimetrics.get("OptimetricsSetups") or {}
+    cache = getattr(app, "_optimetrics_setups_by_type", None)
+    if cache and cache[0] is setups_data:
+        return cache[1]
+    setups_by_type = {}
+    for position, (name, data) in enumerate(setups_data.items()):
+        if isinstance(data, dict):
+            setups_by_type.setdefault(data.get("SetupType"), []).append((position, name, data))
+    app._optimetrics_setups_by_type = (setups_data, setups_by_type)
+    return setups_by_type
+
+
+def _load_setups(app, setup_types, setup_cls):
+    """Build the wrappers of the optimetrics setups stored in a design.
+
+    Parameters
+    ----------
+    app : :class:`pyaedt.application.Analysis.Analysis`
+        Application holding the design.
+    setup_types : tuple or frozenset
+        Setup types to load.
+    setup_cls : type
+        Class used to wrap each setup.
+
+    Returns
+    -------
+    list
+        List of setups in the order in which they are stored in the design.
+    """
+    setups_by_type = _setups_by_type(app)
+    entries = []
+    for setup_type in setup_types:
+        entries.extend(setups_by_type.get(setup_type, []))
+    entries.sort(key=lambda entry: entry[0])
+    return [setup_cls(app, name, data, data["SetupType"]) for _, name, data in entries]
+
+
 class ParametricSetups(object):
     """Sets up Parametrics analyses. It includes Parametrics, Sensitivity and Statistical Analysis.
 
@@ -937,18 +1071,25 @@ class ParametricSetups(object):
 
     def __init__(self, p_app):
         self._app = p_app
-        self.setups = []
-        if self._app.design_properties:
-            try:
-                setups_data = self._app.design_properties["Optimetrics"]["OptimetricsSetups"]
-                for data in setups_data:
-                    if (
-                        isinstance(setups_data[data], (OrderedDict, dict))
-                        and setups_data[data]["SetupType"] == "OptiParametric"
-                    ):
-                        self.setups.append(SetupParam(p_app, data, setups_data[data], setups_data[data]["SetupType"]))
-            except:
-                pass
+        self._setups = None
+
+    @property
+    def setups(self):
+        """List of setups.
+
+        Setups stored in the design are loaded on first access.
+
+        Returns
+        -------
+        list
+        """
+        if self._setups is None:
+            self._setups = _load_setups(self._app, ("OptiParametric",), SetupParam)
+        return self._setups
+
+    @setups.setter
+    def setups(self, value):
+        self._setups = value
 
     @property
     def p_app(self):
@@ -1085,24 +1226,38 @@ class OptimizationSetups(object):
     >>> optimization_setup = app.optimizations
     """
 
+    _optimization_types = frozenset(
+        [
+            "OptiOptimization",
+            "OptiDXDOE",
+            "OptiDesignExplorer",
+            "OptiSLang",
+            "OptiSensitivity",
+            "OptiStatistical",
+        ]
+    )
+
     def __init__(self, p_app):
         self._app = p_app
-        self.setups = []
-        if self._app.design_properties:
-            try:
-                setups_data = self._app.design_properties["Optimetrics"]["OptimetricsSetups"]
-                for data in setups_data:
-                    if isinstance(setups_data[data], (OrderedDict, dict)) and setups_data[data]["SetupType"] in [
-                        "OptiOptimization",
-                        "OptiDXDOE",
-                        "OptiDesignExplorer",
-                        "OptiSLang",
-                        "OptiSensitivity",
-                        "OptiStatistical",
-                    ]:
-                        self.setups.append(SetupOpti(p_app, data, setups_data[data], setups_data[data]["SetupType"]))
-            except:
-                pass
+        self._setups = None
+
+    @property
+    def setups(self):
+        """List of setups.
+
+        Setups stored in the design are loaded on first access.
+
+        Returns
+        -------
+        list
+        """
+        if self._setups is None:
+            self._setups = _load_setups(self._app, self._optimization_types, SetupOpti)
+        return self._setups
+
+    @setups.setter
+    def setups(self, value):
+        self._setups = value
 
     @property
     def p_app(self):
@@ -1229,12 +1384,9 @@ class OptimizationSetups(object):
                 elif self._app.solution_type in ["Q3D Extractor", "2D Extractor"]:
                     report_type = "Matrix"
                 elif context:
-                    try:
-                        for f in self._app.field_setups:
-                            if context == f.name:
-                                report_type = "Far Fields"
-                    except:
-                        pass
+                    for f in getattr(self._app, "field_setups", None) or []:
+                        if context == f.name:
+                            report_type = "Far Fields"
             sweepdefinition = setup._get_context(
                 calculation,
                 condition,
@@ -1256,7 +1408,7 @@ class OptimizationSetups(object):
             for el in variables:
                 try:
                     dx_variables[el] = self._app[el]
-                except:
+                except KeyError:
                     pass
         for v in list(dx_variables.keys()):
             if optim_type in ["OptiOptimization", "OptiDXDOE", "OptiDesignExplorer"]:
@@ -1268,10 +1420,7 @@ class OptimizationSetups(object):
         if optim_type == "OptiDXDOE" and calculation:
             setup.props["CostFunctionGoals"]["Goal"] = sweepdefinition
         if optim_type in ["OptiDesignExplorer", "optiSLang"]:
-            setup.props["Sweeps"]["SweepDefinition"] = []
-            for l, k in dx_variables.items():
-                arg = OrderedDict({"Variable": l, "Data": k, "OffsetF1": False, "Synchronize": 0})
-                setup.props["Sweeps"]["SweepDefinition"].append(arg)
+            setup.props["Sweeps"]["SweepDefinition"] = [_sweep_definition(l, k) for l, k in dx_variables.items()]
         setup.create()
         setup.auto_update = True
         self.setups.append(setup)
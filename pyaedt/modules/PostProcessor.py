@@ -9,6 +9,7 @@ from __future__ import absolute_import  # noreorder
 import os
 import random
 import string
+import tempfile
 import warnings
 from collections import OrderedDict
 
@@ -21,6 +22,7 @@ from pyaedt.generic.general_methods import generate_unique_name
 from pyaedt.generic.general_methods import is_ironpython
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.modeler.Modeler import GeometryModeler
 from pyaedt.modules.solutions import FieldPlot
 from pyaedt.modules.solutions import SolutionData
 
@@ -584,6 +586,36 @@ def _convert_dict_to_report_sel(sweeps):
     return sweep_list
 
 
+@pyaedt_function_handler()
+def _convert_dict_to_variation_list(variations):
+    """Convert variations to the list format expected by the fields calculator.
+
+    Parameters
+    ----------
+    variations : dict, list or None
+        Dictionary of variation variables with their values, or the equivalent
+        ``["Variable:=", value, ...]`` list.
+
+    Returns
+    -------
+    list
+        New ``["Variable:=", value, ...]`` list, which can be extended without modifying
+        the input. The list is empty when ``variations`` is ``None``.
+    """
+    if variations is None:
+        return []
+    if isinstance(variations, dict):
+        variation_list = []
+        for el, value in variations.items():
+            variation_list.extend([el + ":=", value])
+        return variation_list
+    return list(variations)
+
+
+# First element of the animation cache keys of frames exported from temporary field plots.
+_TEMPORARY_PLOTS_CACHE_KEY = "<temporary field plots>"
+
+
 class PostProcessorCommon(object):
     """Manages the main AEDT postprocessing functions.
 
@@ -1826,8 +1858,27 @@ class PostProcessor(PostProcessorCommon, object):
         self._app = app
         self._post_osolution = self._app.osolution
         self.field_plots = self._get_fields_plot()
+        self._aedtplt_cache = {}
         PostProcessorCommon.__init__(self, app)
 
+    @pyaedt_function_handler()
+    def _clear_aedtplt_cache(self, plotname=None):
+        """Remove cached animation frames.
+
+        Parameters
+        ----------
+        plotname : str, optional
+            Name of the field plot whose frames are removed. Frames exported from
+            the temporary plots of :func:`animate_fields_from_aedtplt_2` are keyed with
+            ``_TEMPORARY_PLOTS_CACHE_KEY``. The default is ``None``, in which case
+            all cached frames are removed.
+        """
+        if plotname is None:
+            self._aedtplt_cache.clear()
+            return
+        for key in [k for k in self._aedtplt_cache if k[0] == plotname]:
+            del self._aedtplt_cache[key]
+
     @property
     def _primitives(self):
         """Primitives.
@@ -1849,6 +1900,8 @@ class PostProcessor(PostProcessorCommon, object):
         str
            Model units, such as ``"mm"``.
         """
+        if isinstance(self.modeler, GeometryModeler):
+            return self.modeler.model_units
         return _retry_ntimes(10, self.oeditor.GetModelUnits)
 
     @property
@@ -2112,9 +2165,9 @@ class PostProcessor(PostProcessorCommon, object):
             Name of the quantity to export. For example, ``"Temp"``.
         solution : str, optional
             Name of the solution in the format ``"solution : sweep"``. The default is ``None``.
-        variation_dict : dict, optional
-            Dictionary of all variation variables with their values.
-            The default is ``None``.
+        variation_dict : dict or list, optional
+            Dictionary of all variation variables with their values, or the equivalent
+            ``["Variable:=", value, ...]`` list. The default is ``None``.
         isvector : bool, optional
             Whether the quantity is a vector. The  default is ``False``.
         intrinsics : str, optional
@@ -2163,6 +2216,7 @@ class PostProcessor(PostProcessorCommon, object):
             self.ofieldsreporter.CalcOp(scalar_function)
         if not variation_dict:
             variation_dict = self._app.available_variations.nominal_w_values
+        variation_dict = _convert_dict_to_variation_list(variation_dict)
         if intrinsics:
             if "Transient" in solution:
                 variation_dict.append("Time:=")
@@ -2211,9 +2265,9 @@ class PostProcessor(PostProcessorCommon, object):
             Name of the quantity to export. For example, ``"Temp"``.
         solution : str, optional
             Name of the solution in the format ``"solution : sweep"``. The default is ``None``.
-        variation_dict : dict, optional
-            Dictionary of all variation variables with their values.
-            The default is ``None``.
+        variation_dict : dict or list, optional
+            Dictionary of all variation variables with their values, or the equivalent
+            ``["Variable:=", value, ...]`` list. The default is ``None``.
         filename : str, optional
             Full path and name to save the file to.
             The default is ``None`` which export file in working_directory.
@@ -2279,24 +2333,22 @@ class PostProcessor(PostProcessorCommon, object):
         ang_units = "deg"
         if gridtype == "Cartesian":
             grid_center = ["0mm", "0mm", "0mm"]
-            grid_start_wu = [str(i) + units for i in grid_start]
-            grid_stop_wu = [str(i) + units for i in grid_stop]
-            grid_step_wu = [str(i) + units for i in grid_step]
+            axis_units = (units, units, units)
         elif gridtype == "Cylindrical":
-            grid_center = [str(i) + units for i in grid_center]
-            grid_start_wu = [str(grid_start[0]) + units, str(grid_start[1]) + ang_units, str(grid_start[2]) + units]
-            grid_stop_wu = [str(grid_stop[0]) + units, str(grid_stop[1]) + ang_units, str(grid_stop[2]) + units]
-            grid_step_wu = [str(grid_step[0]) + units, str(grid_step[1]) + ang_units, str(grid_step[2]) + units]
+            grid_center = ["{}{}".format(i, units) for i in grid_center]
+            axis_units = (units, ang_units, units)
         elif gridtype == "Spherical":
-            grid_center = [str(i) + units for i in grid_center]
-            grid_start_wu = [str(grid_start[0]) + units, str(grid_start[1]) + ang_units, str(grid_start[2]) + ang_units]
-            grid_stop_wu = [str(grid_stop[0]) + units, str(grid_stop[1]) + ang_units, str(grid_stop[2]) + ang_units]
-            grid_step_wu = [str(grid_step[0]) + units, str(grid_step[1]) + ang_units, str(grid_step[2]) + ang_units]
+            grid_center = ["{}{}".format(i, units) for i in grid_center]
+            axis_units = (units, ang_units, ang_units)
         else:
             self.logger.error("Error in the type of the grid.")
             return False
+        grid_start_wu = ["{}{}".format(i, u) for i, u in zip(grid_start, axis_units)]
+        grid_stop_wu = ["{}{}".format(i, u) for i, u in zip(grid_stop, axis_units)]
+        grid_step_wu = ["{}{}".format(i, u) for i, u in zip(grid_step, axis_units)]
         if not variation_dict:
             variation_dict = self._app.available_variations.nominal_w_values
+        variation_dict = _convert_dict_to_variation_list(variation_dict)
         if intrinsics:
             if "Transient" in solution:
                 variation_dict.append("Time:=")
@@ -2350,9 +2402,9 @@ class PostProcessor(PostProcessorCommon, object):
         solution : str, optional
             Name of the solution in the format ``"solution: sweep"``.
             The default is ``None``.
-        variation_dict : dict, optional
-            Dictionary of all variation variables with their values.
-            The default is ``None``.
+        variation_dict : dict or list, optional
+            Dictionary of all variation variables with their values, or the equivalent
+            ``["Variable:=", value, ...]`` list. The default is ``None``.
         filename : str, optional
             Full path and name to save the file to.
             The default is ``None`` which export file in working_directory.
@@ -2416,11 +2468,8 @@ class PostProcessor(PostProcessorCommon, object):
                 self.ofieldsreporter.CalcOp("Value")
                 variation_dict = self._app.available_variations.nominal_w_values
             else:
-                variations = self._app.available_variations.nominal_w_values_dict
-                variation_dict = []
-                for el, value in variations.items():
-                    variation_dict.append(el + ":=")
-                    variation_dict.append(value)
+                variation_dict = self._app.available_variations.nominal_w_values_dict
+        variation_dict = _convert_dict_to_variation_list(variation_dict)
         if intrinsics:
             if "Transient" in solution:
                 variation_dict.append("Time:=")
@@ -2893,6 +2942,7 @@ class PostProcessor(PostProcessorCommon, object):
         """
         self.ofieldsreporter.DeleteFieldPlot([name])
         self.field_plots.pop(name, None)
+        self._clear_aedtplt_cache(name)
         return True
 
     @pyaedt_function_handler()
@@ -3045,7 +3095,9 @@ class PostProcessor(PostProcessorCommon, object):
         return solution_data
 
     @pyaedt_function_handler()
-    def export_model_obj(self, obj_list=None, export_path=None, export_as_single_objects=False, air_objects=False):
+    def export_model_obj(
+        self, obj_list=None, export_path=None, export_as_single_objects=False, air_objects=False, use_tempdir=False
+    ):
         """Export the model.
 
         Parameters
@@ -3058,6 +3110,10 @@ class PostProcessor(PostProcessorCommon, object):
             Define if the model will be exported as single obj or list of objs for each object.
         air_objects : bool, optional
             Define if air and vacuum objects will be exported.
+        use_tempdir : bool, optional
+            Export the files into a new temporary directory when ``export_path`` is not provided.
+            The caller is responsible for removing it. The default is ``False``, in which case
+            the files are exported to the working directory.
 
         Returns
         -------
@@ -3068,42 +3124,56 @@ class PostProcessor(PostProcessorCommon, object):
             obj_list = [obj_list]
         assert self._app._aedt_version >= "2021.2", self.logger.error("Object is supported from AEDT 2021 R2.")
         if not export_path:
-            export_path = self._app.working_directory
+            if use_tempdir and not settings.remote_rpc_session:
+                export_path = tempfile.mkdtemp(prefix="pyaedt_obj_")
+            else:
+                export_path = self._app.working_directory
         if not obj_list:
             self._app.modeler.refresh_all_ids()
             obj_list = self._app.modeler.object_names
             if not air_objects:
+                objects = [self._app.modeler[i] for i in obj_list]
                 obj_list = [
-                    i
-                    for i in obj_list
-                    if not self._app.modeler[i].is3d
-                    or (
-                        self._app.modeler[i].material_name.lower() != "vacuum"
-                        and self._app.modeler[i].material_name.lower() != "air"
-                    )
+                    obj.name for obj in objects if not obj.is3d or obj.material_name.lower() not in ["vacuum", "air"]
                 ]
         if export_as_single_objects:
-            files_exported = []
-            for el in obj_list:
-                fname = os.path.join(export_path, "{}.obj".format(el))
-                self._app.modeler.oeditor.ExportModelMeshToFile(fname, [el])
-                if settings.remote_rpc_session_temp_folder:
-                    local_path = "{}/{}".format(settings.remote_rpc_session_temp_folder, "{}.obj".format(el))
-                    fname = check_and_download_file(local_path, fname)
-
-                if not self._app.modeler[el].display_wireframe:
-                    transp = 0.6
-                    if self._app.modeler[el].transparency:
-                        transp = self._app.modeler[el].transparency
-                    files_exported.append([fname, self._app.modeler[el].color, 1 - transp])
-                else:
-                    files_exported.append([fname, self._app.modeler[el].color, 0.05])
-            return files_exported
+            # AEDT scripting calls are serialized by the desktop session, so exports run sequentially.
+            return [self._export_single_obj(el, export_path) for el in obj_list]
         else:
             fname = os.path.join(export_path, "Model_AllObjs_AllMats.obj")
             self._app.modeler.oeditor.ExportModelMeshToFile(fname, obj_list)
             return [[fname, "grey", 0.6]]
 
+    @pyaedt_function_handler()
+    def _export_single_obj(self, obj_name, export_path):
+        """Export a single object to an obj file.
+
+        Parameters
+        ----------
+        obj_name : str
+            Name of the object to export.
+        export_path : str
+            Path of the directory where the obj file is saved.
+
+        Returns
+        -------
+        list
+            List containing the file path, the color and the opacity of the object.
+        """
+        fname = os.path.join(export_path, "{}.obj".format(obj_name))
+        self._app.modeler.oeditor.ExportModelMeshToFile(fname, [obj_name])
+        if settings.remote_rpc_session_temp_folder:
+            local_path = "{}/{}".format(settings.remote_rpc_session_temp_folder, "{}.obj".format(obj_name))
+            fname = check_and_download_file(local_path, fname)
+
+        obj = self._app.modeler[obj_name]
+        if not obj.display_wireframe:
+            transp = 0.6
+            if obj.transparency:
+                transp = obj.transparency
+            return [fname, obj.color, 1 - transp]
+        return [fname, obj.color, 0.05]
+
     @pyaedt_function_handler()
     def export_mesh_obj(self, setup_name=None, intrinsic_dict={}):
         """Export the mesh.
@@ -3127,12 +3197,9 @@ class PostProcessor(PostProcessorCommon, object):
         face_lists = []
         obj_list = self._app.modeler.object_names
         for el in obj_list:
-            obj_id = self._app.modeler.get_obj_id(el)
-            if not self._app.modeler.objects[obj_id].is3d or (
-                self._app.modeler.objects[obj_id].material_name != "vacuum"
-                and self._app.modeler.objects[obj_id].material_name != "air"
-            ):
-                face_lists += self._app.modeler.get_object_faces(obj_id)
+            obj = self._app.modeler.objects[self._app.modeler.get_obj_id(el)]
+            if not obj.is3d or obj.material_name not in ["vacuum", "air"]:
+                face_lists += self._app.modeler.get_object_faces(obj.id)
         plot = self.create_fieldplot_surface(face_lists, "Mesh", setup_name, intrinsic_dict)
         if plot:
             file_to_add = self.export_field_plot(plot.name, project_path)
@@ -10,8 +10,6 @@ from pyaedt import is_ironpython
 from pyaedt import pyaedt_function_handler
 from pyaedt import settings
 from pyaedt.generic.constants import AEDT_UNITS
-from pyaedt.generic.constants import db10
-from pyaedt.generic.constants import db20
 from pyaedt.generic.general_methods import check_and_download_folder
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import write_csv
@@ -31,38 +29,64 @@ if not is_ironpython:
             "The NumPy module is required to run some functionalities of PostProcess.\n"
             "Install with \n\npip install numpy\n\nRequires CPython."
         )
-    try:
-        import pyvista as pv
-    except ImportError:
-        warnings.warn(
-            "The pyvista module is required to run some functionalities of PostProcess.\n"
-            "Install with \n\npip install pyvista\n\nRequires CPython."
-        )
+
+
+def _unit_quantities():
+    """Map each lowercase AEDT unit to the first quantity that defines it."""
+    quantities = {}
+    for quantity, units in AEDT_UNITS.items():
+        for unit in units:
+            quantities.setdefault(unit.lower(), quantity)
+    return quantities
+
+
+_UNIT_QUANTITIES = _unit_quantities()
 
 
 class SolutionData(object):
     """Contains information from the :func:`GetSolutionDataPerVariation` method."""
 
+    __slots__ = (
+        "_original_data",
+        "number_of_variations",
+        "_nominal_variation",
+        "_intrinsics",
+        "active_expression",
+        "_sweeps_names",
+        "variations",
+        "active_intrinsic",
+        "_primary_sweep",
+        "active_variation",
+        "units_sweeps",
+        "units_data",
+        "_solutions_real",
+        "_solutions_imag",
+        "_solutions_mag",
+        "_ifft",
+    )
+
     def __init__(self, aedtdata):
         self._original_data = aedtdata
         self.number_of_variations = len(aedtdata)
 
         self._nominal_variation = None
         self._nominal_variation = self._original_data[0]
+        self._intrinsics = None
         self.active_expression = self.expressions[0]
         self._sweeps_names = []
         self.update_sweeps()
         self.variations = self._get_variations()
+        intrinsics = self._active_intrinsics()
         self.active_intrinsic = OrderedDict({})
-        for k, v in self.intrinsics.items():
+        for k, v in intrinsics.items():
             self.active_intrinsic[k] = v[0]
-        if self.intrinsics:
-            self._primary_sweep = list(self.intrinsics.keys())[0]
+        if intrinsics:
+            self._primary_sweep = list(intrinsics.keys())[0]
         else:
             self._primary_sweep = self._sweeps_names[0]
         self.active_variation = self.variations[0]
         self.units_sweeps = {}
-        for intrinsic in self.intrinsics:
+        for intrinsic in intrinsics:
             try:
                 self.units_sweeps[intrinsic] = self.nominal_variation.GetSweepUnits(intrinsic)
             except:
@@ -112,8 +136,9 @@ class SolutionData(object):
         -------
         list
         """
-        if variation_name in self.intrinsics:
-            return self.intrinsics[variation_name]
+        intrinsics = self._active_intrinsics()
+        if variation_name in intrinsics:
+            return list(intrinsics[variation_name])
         else:
             vars_vals = []
             for el in self.variations:
@@ -124,13 +149,18 @@ class SolutionData(object):
     @property
     def intrinsics(self):
         "Get intrinics dictionary on active variation."
-        _sweeps = OrderedDict({})
-        intrinsics = [i for i in self._sweeps_names if i not in self.nominal_variation.GetDesignVariableNames()]
-        for el in intrinsics:
-            values = list(self.nominal_variation.GetSweepValues(el, False))
-            _sweeps[el] = [i for i in values]
-            _sweeps[el] = list(OrderedDict.fromkeys(_sweeps[el]))
-        return _sweeps
+        return OrderedDict((k, list(v)) for k, v in self._active_intrinsics().items())
+
+    def _active_intrinsics(self):
+        """Get the intrinsics of the nominal variation, read from AEDT once per variation."""
+        if self._intrinsics is None:
+            _sweeps = OrderedDict()
+            design_variables = list(self.nominal_variation.GetDesignVariableNames())
+            for el in self._sweeps_names:
+                if el not in design_variables:
+                    _sweeps[el] = list(OrderedDict.fromkeys(self.nominal_variation.GetSweepValues(el, False)))
+            self._intrinsics = _sweeps
+        return self._intrinsics
 
     @property
     def nominal_variation(self):
@@ -141,6 +171,7 @@ class SolutionData(object):
     def nominal_variation(self, val):
         if 0 <= val <= self.number_of_variations:
             self._nominal_variation = self._original_data[val]
+            self._intrinsics = None
         else:
             print(str(val) + " not in Variations")
 
@@ -168,18 +199,45 @@ class SolutionData(object):
 
     @pyaedt_function_handler()
     def _init_solutions_data(self):
-        self._solutions_real = self._solution_data_real()
-        self._solutions_imag = self._solution_data_imag()
+        solution_keys = self._solution_keys()
+        self._solutions_real = {}
+        self._solutions_imag = {}
         self._solutions_mag = {}
         self.units_data = {}
 
         for expr in self.expressions:
-            self._solutions_mag[expr] = {}
             self.units_data[expr] = self.nominal_variation.GetDataUnits(expr)
-            for i in self._solutions_real[expr]:
-                self._solutions_mag[expr][i] = abs(
-                    complex(self._solutions_real[expr][i], self._solutions_imag[expr][i])
-                )
+            real = {}
+            imag = {}
+            for data, keys in zip(self._original_data, solution_keys):
+                real.update(zip(keys, data.GetRealDataValues(expr, False)))
+                if data.IsDataComplex(expr):
+                    imag.update(zip(keys, data.GetImagDataValues(expr, False)))
+                else:
+                    imag.update(dict.fromkeys(keys, 0))
+            self._solutions_real[expr] = real
+            self._solutions_imag[expr] = imag
+
+    @pyaedt_function_handler()
+    def _solution_magnitude(self, expression):
+        """Get the magnitude values of an expression, computed on first request.
+
+        Parameters
+        ----------
+        expression : str
+            Name of the expression.
+
+        Returns
+        -------
+        dict
+            Dictionary of magnitude values with the same keys as the real values.
+        """
+        if expression not in self._solutions_mag:
+            imag = self._solutions_imag[expression]
+            self._solutions_mag[expression] = {
+                k: math.hypot(v, imag[k]) for k, v in self._solutions_real[expression].items()
+            }
+        return self._solutions_mag[expression]
 
     @pyaedt_function_handler()
     def update_sweeps(self):
@@ -212,57 +270,27 @@ class SolutionData(object):
         -------
 
         """
-        for el in AEDT_UNITS:
-            keys_units = [i.lower() for i in list(AEDT_UNITS[el].keys())]
-            if unit.lower() in keys_units:
-                return el
-        return None
+        return _UNIT_QUANTITIES.get(unit.lower())
 
     @pyaedt_function_handler()
-    def _solution_data_real(self):
-        """ """
-        sols_data = {}
-
-        for expression in self.expressions:
-            solution_Data = {}
+    def _solution_keys(self):
+        """Build the keys of the solution values of each variation.
 
-            for data, comb in zip(self._original_data, self.variations):
-                solution = list(data.GetRealDataValues(expression, False))
-                values = []
-                for el in list(self.intrinsics.keys()):
-                    values.append(list(OrderedDict.fromkeys(data.GetSweepValues(el, False))))
+        Keys only depend on the variation and on its sweep values, so they are computed once
+        and shared by all expressions.
 
-                i = 0
-                c = [comb[v] for v in list(comb.keys())]
-                for t in itertools.product(*values):
-                    solution_Data[tuple(c + list(t))] = solution[i]
-                    i += 1
-            sols_data[expression] = solution_Data
-        return sols_data
-
-    @pyaedt_function_handler()
-    def _solution_data_imag(self):
-        """ """
-        sols_data = {}
-
-        for expression in self.expressions:
-            solution_Data = {}
-            for data, comb in zip(self._original_data, self.variations):
-                if data.IsDataComplex(expression):
-                    solution = list(data.GetImagDataValues(expression, False))
-                else:
-                    l = len(list(data.GetRealDataValues(expression, False)))
-                    solution = [0] * l
-                values = []
-                for el in list(self.intrinsics.keys()):
-                    values.append(list(OrderedDict.fromkeys(data.GetSweepValues(el, False))))
-                i = 0
-                c = [comb[v] for v in list(comb.keys())]
-                for t in itertools.product(*values):
-                    solution_Data[tuple(c + list(t))] = solution[i]
-                    i += 1
-            sols_data[expression] = solution_Data
-        return sols_data
+        Returns
+        -------
+        list
+            List with, for each variation, the list of keys in the order of the solution values.
+        """
+        intrinsics = list(self._active_intrinsics().keys())
+        solution_keys = []
+        for data, comb in zip(self._original_data, self.variations):
+            values = [list(OrderedDict.fromkeys(data.GetSweepValues(el, False))) for el in intrinsics]
+            c = tuple(comb[v] for v in comb)
+            solution_keys.append([c + t for t in itertools.product(*values)])
+        return solution_keys
 
     @staticmethod
     @pyaedt_function_handler()
@@ -280,7 +308,7 @@ class SolutionData(object):
             List of inputs in degrees.
 
         """
-        return [i * 360 / (2 * math.pi) for i in input_list]
+        return [math.degrees(i) for i in input_list]
 
     @staticmethod
     @pyaedt_function_handler()
@@ -298,7 +326,7 @@ class SolutionData(object):
             List of inputs in radians.
 
         """
-        return [i * 2 * math.pi / 360 for i in input_list]
+        return [math.radians(i) for i in input_list]
 
     @pyaedt_function_handler()
     def _variation_tuple(self):
@@ -329,25 +357,47 @@ class SolutionData(object):
             List of data.
 
         """
+        return self._primary_sweep_data("mag", expression, convert_to_SI)
+
+    @pyaedt_function_handler()
+    def _primary_sweep_data(self, component, expression, convert_to_SI):
+        """Extract the values of a solution component along the primary sweep.
+
+        Parameters
+        ----------
+        component : str
+            Component to extract. Options are ``"real"``, ``"imag"``, and ``"mag"``.
+        expression : str
+            Name of the expression. If ``None``, the active expression is used.
+        convert_to_SI : bool
+            Whether to convert the data to the SI unit system.
+
+        Returns
+        -------
+        list or bool
+            List of data, with ``None`` where the variation has no value.
+            ``False`` when the expression is not available.
+        """
         if not expression:
             expression = self.active_expression
-        elif expression not in self.expressions:
+        elif expression not in self._solutions_real:
             return False
+        if component == "mag":
+            solution_Data = self._solution_magnitude(expression)
+        elif component == "imag":
+            solution_Data = self._solutions_imag[expression]
+        else:
+            solution_Data = self._solutions_real[expression]
         temp = self._variation_tuple()
-        solution_Data = self._solutions_mag[expression]
+        position = self._sweeps_names.index(self.primary_sweep)
         sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-        sw = self.variation_values(self.primary_sweep)
-        for el in sw:
+        for el in self.primary_sweep_values:
             temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-        if convert_to_SI and self._quantity(self.units_data[expression]):
-            sol = self._convert_list_to_SI(
-                sol, self._quantity(self.units_data[expression]), self.units_data[expression]
-            )
+            sol.append(solution_Data.get(tuple(temp)))
+        if convert_to_SI:
+            quantity = self._quantity(self.units_data[expression])
+            if quantity:
+                sol = self._convert_list_to_SI(sol, quantity, self.units_data[expression])
         return sol
 
     @staticmethod
@@ -372,7 +422,8 @@ class SolutionData(object):
         """
         sol = datalist
         if dataunits in AEDT_UNITS and units in AEDT_UNITS[dataunits]:
-            sol = [i * AEDT_UNITS[dataunits][units] for i in datalist]
+            scale = AEDT_UNITS[dataunits][units]
+            sol = [i * scale for i in datalist]
         return sol
 
     @pyaedt_function_handler()
@@ -397,10 +448,7 @@ class SolutionData(object):
             List of the data in the database for the expression.
 
         """
-        if not expression:
-            expression = self.active_expression
-
-        return [db10(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        return self.data_db10(expression, convert_to_SI)
 
     @pyaedt_function_handler()
     def data_db10(self, expression=None, convert_to_SI=False):
@@ -423,8 +471,8 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-
-        return [db10(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        log10 = math.log10
+        return [10 * log10(i) for i in self.data_magnitude(expression, convert_to_SI)]
 
     @pyaedt_function_handler()
     def data_db20(self, expression=None, convert_to_SI=False):
@@ -447,8 +495,8 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.active_expression
-
-        return [db20(i) for i in self.data_magnitude(expression, convert_to_SI)]
+        log10 = math.log10
+        return [20 * log10(i) for i in self.data_magnitude(expression, convert_to_SI)]
 
     @pyaedt_function_handler()
     def data_phase(self, expression=None, radians=True):
@@ -501,9 +549,9 @@ class SolutionData(object):
         expression = self.active_expression
         temp = self._variation_tuple()
 
-        solution_Data = list(self._solutions_real[expression].keys())
+        solution_Data = self._solutions_real[expression]
         sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
+        position = self._sweeps_names.index(self.primary_sweep)
 
         for el in self.primary_sweep_values:
             temp[position] = el
@@ -537,26 +585,7 @@ class SolutionData(object):
             List of the real data for the expression.
 
         """
-        if not expression:
-            expression = self.active_expression
-        temp = self._variation_tuple()
-
-        solution_Data = self._solutions_real[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-
-        for el in self.primary_sweep_values:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-
-        if convert_to_SI and self._quantity(self.units_data[expression]):
-            sol = self._convert_list_to_SI(
-                sol, self._quantity(self.units_data[expression]), self.units_data[expression]
-            )
-        return sol
+        return self._primary_sweep_data("real", expression, convert_to_SI)
 
     @pyaedt_function_handler()
     def data_imag(self, expression=None, convert_to_SI=False):
@@ -577,24 +606,7 @@ class SolutionData(object):
             List of the imaginary data for the expression.
 
         """
-        if not expression:
-            expression = self.active_expression
-        temp = self._variation_tuple()
-
-        solution_Data = self._solutions_imag[expression]
-        sol = []
-        position = list(self._sweeps_names).index(self.primary_sweep)
-        for el in self.primary_sweep_values:
-            temp[position] = el
-            try:
-                sol.append(solution_Data[tuple(temp)])
-            except KeyError:
-                sol.append(None)
-        if convert_to_SI and self._quantity(self.units_data[expression]):
-            sol = self._convert_list_to_SI(
-                sol, self._quantity(self.units_data[expression]), self.units_data[expression]
-            )
-        return sol
+        return self._primary_sweep_data("imag", expression, convert_to_SI)
 
     @pyaedt_function_handler()
     def is_real_only(self, expression=None):
@@ -785,29 +797,28 @@ class SolutionData(object):
 
         if not math_formula:
             math_formula = "mag"
-        theta = self.variation_values(x_axis)
         y_axis_val = self.variation_values(y_axis)
+        theta = np.deg2rad(self.variation_values(x_axis))
+        phi = np.deg2rad(y_axis_val)
 
-        phi = []
-        r = []
-        for el in y_axis_val:
+        r = np.empty((len(phi), len(theta)))
+        for i, el in enumerate(y_axis_val):
             self.active_variation[y_axis] = el
-            phi.append(el * math.pi / 180)
 
             if math_formula == "re":
-                r.append(self.data_real(curve))
+                r[i] = self.data_real(curve)
             elif math_formula == "im":
-                r.append(self.data_imag(curve))
+                r[i] = self.data_imag(curve)
             elif math_formula == "db20":
-                r.append(self.data_db20(curve))
+                r[i] = self.data_db20(curve)
             elif math_formula == "db10":
-                r.append(self.data_db10(curve))
+                r[i] = self.data_db10(curve)
             elif math_formula == "mag":
-                r.append(self.data_magnitude(curve))
+                r[i] = self.data_magnitude(curve)
             elif math_formula == "phasedeg":
-                r.append(self.data_phase(curve, False))
+                r[i] = self.data_phase(curve, False)
             elif math_formula == "phaserad":
-                r.append(self.data_phase(curve, True))
+                r[i] = self.data_phase(curve, True)
         data_plot = [theta, phi, r]
         if not xlabel:
             xlabel = x_axis
@@ -1012,8 +1023,8 @@ class FfdSolutionData(object):
                 phi_range = np.linspace(*phi)
                 if os.path.exists(self.ffd_dict[port]):
                     eep_txt = np.loadtxt(self.ffd_dict[port], skiprows=4)
-                    Etheta = np.vectorize(complex)(eep_txt[:, 0], eep_txt[:, 1])
-                    Ephi = np.vectorize(complex)(eep_txt[:, 2], eep_txt[:, 3])
+                    Etheta = eep_txt[:, 0] + 1j * eep_txt[:, 1]
+                    Ephi = eep_txt[:, 2] + 1j * eep_txt[:, 3]
                     # eep=np.column_stack((etheta, ephi))
                     temp_dict["Theta"] = theta_range
                     temp_dict["Phi"] = phi_range
@@ -1277,93 +1288,142 @@ class FfdSolutionData(object):
         return w1 * w2
 
     @pyaedt_function_handler()
-    def beamform(self, phi_scan=0, theta_scan=0):
-        """Compute the far field pattern calculated for a specific phi/scan angle requested.
-        This is calculated based on the lattice vector spacing and the embedded element
-        patterns of a ca-ddm or fa-ddm array in HFSS.
-        Calculates phase shifts between array elements in A and B directions,
-        PhaseShiftA and PhaseShiftB, given Wave Vector (k), lattice vectors
-        (Ax, Ay, Bx, By), Scan angles (theta, phi) using formula below
+    def _taper_magnitudes(self, indices):
+        """Compute the taper magnitude of each array element.
+
+        Parameters
+        ----------
+        indices : :class:`numpy.ndarray`
+            Array of shape ``(num_ports, 2)`` with the element indices.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Magnitude of each element.
+        """
+        return np.array([np.round(np.abs(self.assign_weight(a, b, taper=self.taper)), 3) for a, b in indices])
+
+    @pyaedt_function_handler()
+    def _progressive_phase_weights(self, indices, phi_scan, theta_scan, mag=None):
+        """Compute the complex weights of all array elements for a scan angle.
+
+        Phase shifts between array elements in A and B directions are computed
+        from the wave vector, the lattice vectors and the scan angles:
         Phase Shift A = - (Ax*k*sin(theta)*cos(phi) + Ay*k*sin(theta)*sin(phi))
         Phase Shift B = - (Bx*k*sin(theta)*cos(phi) + By*k*sin(theta)*sin(phi)).
 
         Parameters
         ----------
+        indices : :class:`numpy.ndarray`
+            Array of shape ``(num_ports, 2)`` with the element indices.
         phi_scan : int, float
             Spherical cs for desired scan angle of beam.
-        theta_scan: : int, float
+        theta_scan : int, float
             Spherical cs for desired scan angle of beam.
+        mag : :class:`numpy.ndarray`, optional
+            Taper magnitude of each element. The default is ``None``, in which
+            case it is computed from the array taper.
 
         Returns
         -------
-        dict
-            Updated quantities dictionary.
+        :class:`numpy.ndarray`
+            Complex weight of each element.
         """
-        num_ports = len(self.all_port_names)
-        self.array_center_and_edge()
-
+        if mag is None:
+            mag = self._taper_magnitudes(indices)
         c = 299792458
         k = (2 * math.pi * self.frequency) / c
-
         theta_scan = math.radians(theta_scan)
         phi_scan = math.radians(phi_scan)
+        k_x = k * math.sin(theta_scan) * math.cos(phi_scan)
+        k_y = k * math.sin(theta_scan) * math.sin(phi_scan)
+        phase_shift_A_rad = -(self.Ax * k_x + self.Ay * k_y)
+        phase_shift_B_rad = -(self.Bx * k_x + self.By * k_y)
+        w_ang = indices[:, 0] * phase_shift_A_rad + indices[:, 1] * phase_shift_B_rad
+        return np.sqrt(mag) * np.exp(1j * w_ang)
 
-        phase_shift_A_rad = -1 * (
-            (self.Ax * k * math.sin(theta_scan) * math.cos(phi_scan))
-            + (self.Ay * k * math.sin(theta_scan) * math.sin(phi_scan))
-        )
-        phase_shift_B_rad = -1 * (
-            (self.Bx * k * math.sin(theta_scan) * math.cos(phi_scan))
-            + (self.By * k * math.sin(theta_scan) * math.sin(phi_scan))
-        )
+    @pyaedt_function_handler()
+    def _combine_port_fields(self, w_dict):
+        """Compute the weighted sum of the far fields of all ports.
 
-        w_dict = {}
-        w_dict_ang = {}
-        w_dict_mag = {}
-        array_positions = {}
-        for port_name in self.all_port_names:
-            index_str = self.get_array_index(port_name)
-            a = index_str[0] - 1
-            b = index_str[1] - 1
-            w_mag = np.round(np.abs(self.assign_weight(a, b, taper=self.taper)), 3)
-            w_ang = a * phase_shift_A_rad + b * phase_shift_B_rad
-            w_dict[port_name] = np.sqrt(w_mag) * np.exp(1j * w_ang)
-            w_dict_ang[port_name] = w_ang
-            w_dict_mag[port_name] = w_mag
-            array_positions[port_name] = self.element_location(a, b)
+        Parameters
+        ----------
+        w_dict : dict
+            Complex weight of each port.
 
-        length_of_ff_data = len(self.data_dict[self.all_port_names[0]]["rETheta"])
+        Returns
+        -------
+        list
+            List containing the array of weights and the ``rETheta`` and ``rEPhi`` combined
+            fields reshaped on the theta and phi grid.
+        """
+        num_ports = len(self.all_port_names)
+        first_port = self.data_dict[self.all_port_names[0]]
+        length_of_ff_data = len(first_port["rETheta"])
+        shape = (len(first_port["Theta"]), len(first_port["Phi"]))
 
-        rEtheta_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        rEphi_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        w = np.zeros((1, num_ports), dtype=complex)
+        rEtheta_fields = np.empty((num_ports, length_of_ff_data), dtype=np.complex128)
+        rEphi_fields = np.empty_like(rEtheta_fields)
+        w = np.empty(num_ports, dtype=np.complex128)
         # create port mapping
         for n, port in enumerate(self.all_port_names):
-            re_theta = self.data_dict[port]["rETheta"]  # this is re_theta index of loaded data
-            re_phi = self.data_dict[port]["rEPhi"]  # this is re_ohi index of loaded data
+            w[n] = w_dict[port]
+            np.copyto(rEtheta_fields[n], self.data_dict[port]["rETheta"])
+            np.copyto(rEphi_fields[n], self.data_dict[port]["rEPhi"])
+
+        rEtheta_fields_sum = np.empty(length_of_ff_data, dtype=np.complex128)
+        rEphi_fields_sum = np.empty(length_of_ff_data, dtype=np.complex128)
+        np.dot(w, rEtheta_fields, out=rEtheta_fields_sum)
+        np.dot(w, rEphi_fields, out=rEphi_fields_sum)
+        return [w, rEtheta_fields_sum.reshape(shape), rEphi_fields_sum.reshape(shape)]
 
-            w[0][n] = w_dict[port]  # build 1xNumPorts array of weights
+    @pyaedt_function_handler()
+    def beamform(self, phi_scan=0, theta_scan=0):
+        """Compute the far field pattern calculated for a specific phi/scan angle requested.
+        This is calculated based on the lattice vector spacing and the embedded element
+        patterns of a ca-ddm or fa-ddm array in HFSS.
+        Calculates phase shifts between array elements in A and B directions,
+        PhaseShiftA and PhaseShiftB, given Wave Vector (k), lattice vectors
+        (Ax, Ay, Bx, By), Scan angles (theta, phi) using formula below
+        Phase Shift A = - (Ax*k*sin(theta)*cos(phi) + Ay*k*sin(theta)*sin(phi))
+        Phase Shift B = - (Bx*k*sin(theta)*cos(phi) + By*k*sin(theta)*sin(phi)).
 
-            rEtheta_fields[n] = re_theta
-            rEphi_fields[n] = re_phi
+        Parameters
+        ----------
+        phi_scan : int, float
+            Spherical cs for desired scan angle of beam.
+        theta_scan: : int, float
+            Spherical cs for desired scan angle of beam.
 
-            theta_range = self.data_dict[port]["Theta"]
-            phi_range = self.data_dict[port]["Phi"]
-            Ntheta = len(theta_range)
-            Nphi = len(phi_range)
+        Returns
+        -------
+        dict
+            Updated quantities dictionary.
+        """
+        self.array_center_and_edge()
 
-        rEtheta_fields_sum = np.dot(w, rEtheta_fields)
-        rEtheta_fields_sum = np.reshape(rEtheta_fields_sum, (Ntheta, Nphi))
+        indices = np.array([self.get_array_index(port_name) for port_name in self.all_port_names]) - 1
+        w_dict = dict(zip(self.all_port_names, self._progressive_phase_weights(indices, phi_scan, theta_scan)))
+        array_positions = {}
+        for port_name, (a, b) in zip(self.all_port_names, indices):
+            array_positions[port_name] = self.element_location(a, b)
 
-        rEphi_fields_sum = np.dot(w, rEphi_fields)
-        rEphi_fields_sum = np.reshape(rEphi_fields_sum, (Ntheta, Nphi))
+        w, rEtheta_fields_sum, rEphi_fields_sum = self._combine_port_fields(w_dict)
+        theta_range = self.data_dict[self.all_port_names[0]]["Theta"]
+        phi_range = self.data_dict[self.all_port_names[0]]["Phi"]
+        Ntheta = len(theta_range)
+        Nphi = len(phi_range)
 
         self.all_qtys = {}
         self.all_qtys["rEPhi"] = rEphi_fields_sum
         self.all_qtys["rETheta"] = rEtheta_fields_sum
-        self.all_qtys["rETotal"] = np.sqrt(
-            np.power(np.abs(rEphi_fields_sum), 2) + np.power(np.abs(rEtheta_fields_sum), 2)
+        rETotal_sq = (
+            rEphi_fields_sum.real**2
+            + rEphi_fields_sum.imag**2
+            + rEtheta_fields_sum.real**2
+            + rEtheta_fields_sum.imag**2
         )
+        self.all_qtys["rETotal"] = np.sqrt(rETotal_sq)
         self.all_qtys["Theta"] = theta_range
         self.all_qtys["Phi"] = phi_range
         self.all_qtys["nPhi"] = Nphi
@@ -1371,11 +1431,12 @@ class FfdSolutionData(object):
         pin = np.sum(np.power(np.abs(w), 2))
         self.all_qtys["Pincident"] = pin
         self._app.logger.info("Incident Power: %s", pin)
-        real_gain = 2 * np.pi * np.abs(np.power(self.all_qtys["rETotal"], 2)) / pin / 377
+        real_gain = (2 * np.pi / (pin * 377)) * rETotal_sq
+        real_gain_db = 10 * np.log10(real_gain)
         self.all_qtys["RealizedGain"] = real_gain
-        self.all_qtys["RealizedGain_dB"] = 10 * np.log10(real_gain)
-        self.max_gain = np.max(10 * np.log10(real_gain))
-        self.min_gain = np.min(10 * np.log10(real_gain))
+        self.all_qtys["RealizedGain_dB"] = real_gain_db
+        self.max_gain = np.max(real_gain_db)
+        self.min_gain = np.min(real_gain_db)
         self._app.logger.info("Peak Realized Gain: %s dB", self.max_gain)
         self.all_qtys["Element_Location"] = array_positions
 
@@ -1403,95 +1464,33 @@ class FfdSolutionData(object):
         dict
             Updated quantities dictionary.
         """
-        num_ports = len(self.all_port_names)
         self.array_center_and_edge()
 
-        c = 299792458
-        k = (2 * math.pi * self.frequency) / c
-
-        # ---------------------- METHOD : CalculatePhaseShifts -------------------
-        # Calculates phase shifts between array elements in A and B directions,
-        # PhaseShiftA and PhaseShiftB, given Wave Vector (k), lattice vectors
-        # (Ax, Ay, Bx, By), Scan angles (theta, phi) using formula below
-        # Phase Shift A = - (Ax*k*sin(theta)*cos(phi) + Ay*k*sin(theta)*sin(phi))
-        # Phase Shift B = - (Bx*k*sin(theta)*cos(phi) + By*k*sin(theta)*sin(phi))
-        # ------------------------------------------------------------------------
-
-        theta_scan1 = math.radians(theta_scan1)
-        phi_scan1 = math.radians(phi_scan1)
-
-        theta_scan2 = math.radians(theta_scan2)
-        phi_scan2 = math.radians(phi_scan2)
-
-        phase_shift_A_rad1 = -1 * (
-            (self.Ax * k * math.sin(theta_scan1) * math.cos(phi_scan1))
-            + (self.Ay * k * math.sin(theta_scan1) * math.sin(phi_scan1))
-        )
-        phase_shift_B_rad1 = -1 * (
-            (self.Bx * k * math.sin(theta_scan1) * math.cos(phi_scan1))
-            + (self.By * k * math.sin(theta_scan1) * math.sin(phi_scan1))
-        )
-
-        phase_shift_A_rad2 = -1 * (
-            (self.Ax * k * math.sin(theta_scan2) * math.cos(phi_scan2))
-            + (self.Ay * k * math.sin(theta_scan2) * math.sin(phi_scan2))
-        )
-        phase_shift_B_rad2 = -1 * (
-            (self.Bx * k * math.sin(theta_scan2) * math.cos(phi_scan2))
-            + (self.By * k * math.sin(theta_scan2) * math.sin(phi_scan2))
-        )
-
-        w_dict = {}
-        w_dict_ang = {}
-        w_dict_mag = {}
+        indices = np.array([self.get_array_index(port_name) for port_name in self.all_port_names])
+        w_mag = self._taper_magnitudes(indices)
+        w = self._progressive_phase_weights(indices, phi_scan1, theta_scan1, w_mag)
+        w += self._progressive_phase_weights(indices, phi_scan2, theta_scan2, w_mag)
+        w_dict = dict(zip(self.all_port_names, w))
         array_positions = {}
-        for port_name in self.all_port_names:
-            index_str = self.get_array_index(port_name)
-            a = index_str[0]
-            b = index_str[1]
-            w_mag1 = np.round(np.abs(self.assign_weight(a, b, taper=self.taper)), 3)
-            w_ang1 = a * phase_shift_A_rad1 + b * phase_shift_B_rad1
-
-            w_mag2 = np.round(np.abs(self.assign_weight(a, b, taper=self.taper)), 3)
-            w_ang2 = a * phase_shift_A_rad2 + b * phase_shift_B_rad2
-
-            w_dict[port_name] = np.sqrt(w_mag1) * np.exp(1j * w_ang1) + np.sqrt(w_mag2) * np.exp(1j * w_ang2)
-            w_dict_ang[port_name] = np.angle(w_dict[port_name])
-            w_dict_mag[port_name] = np.abs(w_dict[port_name])
-
+        for port_name, (a, b) in zip(self.all_port_names, indices):
             array_positions[port_name] = self.element_location(a, b)
 
-        length_of_ff_data = len(self.data_dict[self.all_port_names[0]]["rETheta"])
-        rEtheta_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        rEphi_fields = np.zeros((num_ports, length_of_ff_data), dtype=complex)
-        w = np.zeros((1, num_ports), dtype=complex)
-        # create port mapping
-        for n, port in enumerate(self.all_port_names):
-            re_theta = self.data_dict[port]["rETheta"]  # this is re_theta index of loaded data
-            re_phi = self.data_dict[port]["rEPhi"]  # this is re_ohi index of loaded data
-
-            w[0][n] = w_dict[port]  # build 1xNumPorts array of weights
-
-            rEtheta_fields[n] = re_theta
-            rEphi_fields[n] = re_phi
-
-            theta_range = self.data_dict[port]["Theta"]
-            phi_range = self.data_dict[port]["Phi"]
-            Ntheta = len(theta_range)
-            Nphi = len(phi_range)
-
-        rEtheta_fields_sum = np.dot(w, rEtheta_fields)
-        rEtheta_fields_sum = np.reshape(rEtheta_fields_sum, (Ntheta, Nphi))
-
-        rEphi_fields_sum = np.dot(w, rEphi_fields)
-        rEphi_fields_sum = np.reshape(rEphi_fields_sum, (Ntheta, Nphi))
+        w, rEtheta_fields_sum, rEphi_fields_sum = self._combine_port_fields(w_dict)
+        theta_range = self.data_dict[self.all_port_names[0]]["Theta"]
+        phi_range = self.data_dict[self.all_port_names[0]]["Phi"]
+        Ntheta = len(theta_range)
+        Nphi = len(phi_range)
 
         self.all_qtys = {}
         self.all_qtys["rEPhi"] = rEphi_fields_sum
         self.all_qtys["rETheta"] = rEtheta_fields_sum
-        self.all_qtys["rETotal"] = np.sqrt(
-            np.power(np.abs(rEphi_fields_sum), 2) + np.power(np.abs(rEtheta_fields_sum), 2)
+        rETotal_sq = (
+            rEphi_fields_sum.real**2
+            + rEphi_fields_sum.imag**2
+            + rEtheta_fields_sum.real**2
+            + rEtheta_fields_sum.imag**2
         )
+        self.all_qtys["rETotal"] = np.sqrt(rETotal_sq)
         self.all_qtys["Theta"] = theta_range
         self.all_qtys["Phi"] = phi_range
         self.all_qtys["nPhi"] = Nphi
@@ -1499,11 +1498,12 @@ class FfdSolutionData(object):
         pin = np.sum(np.power(np.abs(w), 2))
         self.all_qtys["Pincident"] = pin
         self._app.logger.info("Incident Power: %s", pin)
-        real_gain = 2 * np.pi * np.abs(np.power(self.all_qtys["rETotal"], 2)) / pin / 377
+        real_gain = (2 * np.pi / (pin * 377)) * rETotal_sq
+        real_gain_db = 10 * np.log10(real_gain)
         self.all_qtys["RealizedGain"] = real_gain
-        self.all_qtys["RealizedGain_dB"] = 10 * np.log10(real_gain)
-        self.max_gain = np.max(10 * np.log10(real_gain))
-        self.min_gain = np.min(10 * np.log10(real_gain))
+        self.all_qtys["RealizedGain_dB"] = real_gain_db
+        self.max_gain = np.max(real_gain_db)
+        self.min_gain = np.min(real_gain_db)
         self._app.logger.info("Peak Realized Gain: %s dB", self.max_gain)
         self.all_qtys["Element_Location"] = array_positions
 
@@ -1879,6 +1879,8 @@ class FfdSolutionData(object):
         -------
         PyVista object
         """
+        import pyvista as pv
+
         if not position:
             position = np.zeros(3)
         elif isinstance(position, (list, tuple)):
@@ -2022,6 +2024,8 @@ class FfdSolutionData(object):
         -------
         PyVista object
         """
+        import pyvista as pv
+
         if not position:
             position = np.zeros(3)
         elif isinstance(position, (list, tuple)):
@@ -2220,7 +2224,7 @@ class Update2BeamForms:
         self._update_both()
 
 
-class FieldPlot:
+class FieldPlot(object):
     """Creates and edits field plots.
 
     Parameters
@@ -2238,6 +2242,38 @@ class FieldPlot:
 
     """
 
+    __slots__ = (
+        "_postprocessor",
+        "oField",
+        "volume_indexes",
+        "surfaces_indexes",
+        "line_indexes",
+        "cutplane_indexes",
+        "solutionName",
+        "quantityName",
+        "intrinsincList",
+        "name",
+        "plotFolder",
+        "Filled",
+        "IsoVal",
+        "SmoothShade",
+        "AddGrid",
+        "MapTransparency",
+        "Refinement",
+        "Transparency",
+        "SmoothingLevel",
+        "ArrowUniform",
+        "ArrowSpacing",
+        "MinArrowSpacing",
+        "MaxArrowSpacing",
+        "GridColor",
+        "PlotIsoSurface",
+        "PointSize",
+        "CloudSpacing",
+        "CloudMinSpacing",
+        "CloudMaxSpacing",
+    )
+
     def __init__(
         self,
         postprocessor,
@@ -2293,20 +2329,18 @@ class FieldPlot:
             idx += 1
         info = [idx]
         if self.volume_indexes:
-            info.append("Volume")
-            info.append("ObjList")
-            info.append(len(self.volume_indexes))
-            for index in self.volume_indexes:
-                info.append(str(index))
+            info.extend(["Volume", "ObjList", len(self.volume_indexes)])
+            info.extend(map(str, self.volume_indexes))
         if self.surfaces_indexes:
             model_faces = []
             nonmodel_faces = []
-            models = self._postprocessor.modeler.model_objects
+            models = set(self._postprocessor.modeler.model_objects)
+            oeditor = self._postprocessor.modeler.oeditor
             for index in self.surfaces_indexes:
                 try:
                     if isinstance(index, FacePrimitive):
                         index = index.id
-                    oname = self._postprocessor.modeler.oeditor.GetObjectNameByFaceID(index)
+                    oname = oeditor.GetObjectNameByFaceID(index)
                     if oname in models:
                         model_faces.append(str(index))
                     else:
@@ -2315,26 +2349,17 @@ class FieldPlot:
                     pass
             info.append("Surface")
             if model_faces:
-                info.append("FacesList")
-                info.append(len(model_faces))
-                for index in model_faces:
-                    info.append(index)
+                info.extend(["FacesList", len(model_faces)])
+                info.extend(model_faces)
             if nonmodel_faces:
-                info.append("NonModelFaceList")
-                info.append(len(nonmodel_faces))
-                for index in nonmodel_faces:
-                    info.append(index)
+                info.extend(["NonModelFaceList", len(nonmodel_faces)])
+                info.extend(nonmodel_faces)
         if self.cutplane_indexes:
-            info.append("Surface")
-            info.append("CutPlane")
-            info.append(len(self.cutplane_indexes))
-            for index in self.cutplane_indexes:
-                info.append(str(index))
+            info.extend(["Surface", "CutPlane", len(self.cutplane_indexes)])
+            info.extend(map(str, self.cutplane_indexes))
         if self.line_indexes:
-            info.append("Line")
-            info.append(len(self.line_indexes))
-            for index in self.line_indexes:
-                info.append(str(index))
+            info.extend(["Line", len(self.line_indexes)])
+            info.extend(map(str, self.line_indexes))
         return info
 
     @property
@@ -2346,7 +2371,7 @@ class FieldPlot:
         list or dict
             List or dictionary of the variables for the field plot.
         """
-        var = ""
+        var = []
         if type(self.intrinsincList) is list:
             l = 0
             while l < len(self.intrinsincList):
@@ -2354,12 +2379,12 @@ class FieldPlot:
                 if ":=" in self.intrinsincList[l] and isinstance(self.intrinsincList[l + 1], list):
                     val = self.intrinsincList[l + 1][0]
                 ll = self.intrinsincList[l].split(":=")
-                var += ll[0] + "='" + str(val) + "' "
+                var.append("{}='{}' ".format(ll[0], val))
                 l += 2
         else:
-            for a in self.intrinsincList:
-                var += a + "='" + str(self.intrinsincList[a]) + "' "
-        return var
+            for a, val in self.intrinsincList.items():
+                var.append("{}='{}' ".format(a, val))
+        return "".join(var)
 
     @property
     def plotsettings(self):
@@ -2544,6 +2569,7 @@ class FieldPlot:
             ``True`` when successful, ``False`` when failed.
         """
         self.oField.ModifyFieldPlot(self.name, self.surfacePlotInstruction)
+        self._postprocessor._clear_aedtplt_cache(self.name)
 
     @pyaedt_function_handler()
     def update_field_plot_settings(self):
@@ -2562,6 +2588,7 @@ class FieldPlot:
         """Delete the field plot."""
         self.oField.DeleteFieldPlot([self.name])
         self._postprocessor.field_plots.pop(self.name, None)
+        self._postprocessor._clear_aedtplt_cache(self.name)
 
     @pyaedt_function_handler()
     def change_plot_scale(self, minimum_value, maximum_value, is_log=False, is_db=False):